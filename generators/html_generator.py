@@ -6,12 +6,13 @@ Generates static HTML from trending content using Jinja2 templates.
 from jinja2 import Environment, FileSystemLoader
 from datetime import datetime, timezone
 from typing import List, Dict
-import json
 import shutil
 import os
 import logging
 from dateutil import parser as date_parser
 
+from processors.json_io import write_json
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,7 +32,11 @@ def format_time_ago(timestamp) -> str:
             dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
         # Handle ISO string (News)
         elif isinstance(timestamp, str):
-            dt = date_parser.isoparse(timestamp)
+            # Fast path for our own isoformat() output, dateutil for the rest
+            try:
+                dt = datetime.fromisoformat(timestamp)
+            except ValueError:
+                dt = date_parser.isoparse(timestamp)
             # Make timezone-aware if needed
             if dt.tzinfo is None:
                 dt = dt.replace(tzinfo=timezone.utc)
@@ -79,14 +84,19 @@ class HTMLGenerator:
         """
         self.template_dir = template_dir
         self.output_dir = output_dir
+        self.archive_dir = os.path.join(output_dir, 'archive')
 
         # Ensure output directory exists
         os.makedirs(output_dir, exist_ok=True)
 
         # Set up Jinja2 environment
+        # Templates don't change during a run, so skip the per-lookup mtime
+        # check and keep every compiled template cached
         self.env = Environment(
             loader=FileSystemLoader(template_dir),
-            autoescape=True
+            autoescape=True,
+            auto_reload=False,
+            cache_size=-1
         )
 
         # Add custom filters
@@ -149,8 +159,7 @@ class HTMLGenerator:
             'content': trending_content[:100],  # Top 100 items
         }
 
-        with open(data_path, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        write_json(data_path, output)
 
         logger.info(f"Generated JSON: {data_path}")
 
@@ -178,11 +187,9 @@ class HTMLGenerator:
             summary: Optional AI-generated summary
         """
         # Create archive directory
-        archive_dir = os.path.join(self.output_dir, 'archive')
-        os.makedirs(archive_dir, exist_ok=True)
+        os.makedirs(self.archive_dir, exist_ok=True)
 
         # Format date for display
-        from datetime import datetime
         try:
             date_obj = datetime.strptime(date, '%Y%m%d')
             date_formatted = date_obj.strftime('%B %d, %Y')
@@ -191,7 +198,7 @@ class HTMLGenerator:
 
         # Generate filename
         filename = f"{date}.html"
-        output_path = os.path.join(archive_dir, filename)
+        output_path = os.path.join(self.archive_dir, filename)
 
         # Use archive template
         template = self.env.get_template('archive.html.j2')
@@ -211,11 +218,30 @@ class HTMLGenerator:
 
         logger.info(f"Generated archive page: {output_path}")
 
+    def generate_all(self, trending_content: List[Dict], stats: Dict,
+                     summary: str = None, date: str = None):
+        """
+        Generate the main site and, if a date is given, its archive page and index.
+
+        Steps run in order and stop at the first error.
+
+        Args:
+            trending_content: List of ranked content dictionaries
+            stats: Site statistics (post counts, etc.)
+            summary: Optional AI-generated summary of the day's content
+            date: Date string (YYYYMMDD) for the archive page; skipped if None
+        """
+        self.generate_site(trending_content, stats, summary=summary)
+
+        if date:
+            self.generate_archive_page(date, trending_content, stats, summary)
+            self.generate_archive_index()
+
     def generate_archive_index(self):
         """
         Generate archive index page listing all available archive days.
         """
-        archive_dir = os.path.join(self.output_dir, 'archive')
+        archive_dir = self.archive_dir
 
         if not os.path.exists(archive_dir):
             logger.warning("No archive directory found")
@@ -229,7 +255,6 @@ class HTMLGenerator:
         for filename in archive_files:
             date_str = filename.replace('.html', '')
             try:
-                from datetime import datetime
                 date_obj = datetime.strptime(date_str, '%Y%m%d')
                 archives.append({
                     'date': date_str,
@@ -242,65 +267,9 @@ class HTMLGenerator:
         # Generate index page
         index_path = os.path.join(archive_dir, 'index.html')
 
-        html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Canadian Pet Pulse - Archive</title>
-    <link rel="stylesheet" href="../styles.css">
-</head>
-<body>
-    <header>
-        <div class="container">
-            <h1>🐾 Canadian Pet Pulse</h1>
-            <p class="subtitle">Content Archive</p>
-            <p><a href="../index.html" style="color: white; text-decoration: underline;">← Back to Today</a></p>
-        </div>
-    </header>
-
-    <main class="container">
-        <section class="trending-content">
-            <h2>Browse Past Days</h2>
-            <div style="max-width: 600px; margin: 0 auto;">
-"""
-
-        for archive in archives:
-            html += f"""
-                <div style="background: white; padding: 20px; margin-bottom: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                    <h3 style="margin: 0 0 10px 0;">
-                        <a href="{archive['filename']}" style="color: #E74C3C; text-decoration: none;">
-                            {archive['date_formatted']}
-                        </a>
-                    </h3>
-                    <p style="color: #666; margin: 0;">View curated Canadian pet content from this day</p>
-                </div>
-"""
-
-        if not archives:
-            html += """
-                <div class="empty-state">
-                    <div class="empty-state-icon">🐕</div>
-                    <p class="empty-state-text">No archived content yet</p>
-                    <p class="empty-state-subtext">Check back after your first daily update!</p>
-                </div>
-"""
-
-        html += """
-            </div>
-        </section>
-    </main>
-
-    <footer>
-        <div class="container">
-            <p><strong>Canadian Pet Pulse</strong> - Browse historical content</p>
-            <p><a href="../index.html">View Today's Content</a></p>
-            <p><a href="https://github.com/harrisonhjohnson/canada-pet-pulse" target="_blank" rel="noopener noreferrer">View on GitHub</a></p>
-        </div>
-    </footer>
-</body>
-</html>
-"""
+        # Render the whole listing in one template pass
+        template = self.env.get_template('archive_index.html.j2')
+        html = template.render(archives=archives)
 
         with open(index_path, 'w', encoding='utf-8') as f:
             f.write(html)
@@ -310,6 +279,8 @@ class HTMLGenerator:
 
 # Example usage and testing
 if __name__ == '__main__':
+    # Demo: run from the project root as `python -m generators.html_generator`
+    # so the processors package is importable.
     import sys
     from pathlib import Path
 
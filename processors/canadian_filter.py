@@ -7,6 +7,8 @@ import re
 from typing import Dict, List
 import logging
 
+from processors.keyword_matcher import KeywordMatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -64,11 +66,12 @@ class CanadianFilter:
         # Compile postal code regex for efficiency
         self.postal_code_regex = re.compile(self.POSTAL_CODE_PATTERN, re.IGNORECASE)
 
-        # Compile word boundary patterns for cities
-        self.city_patterns = [
-            re.compile(r'\b' + re.escape(city) + r'\b', re.IGNORECASE)
-            for city in self.CITIES
-        ]
+        # One word-boundary alternation for all cities (scans text once;
+        # city names never overlap, so distinct matches == cities mentioned)
+        self.city_regex = re.compile(
+            r'\b(?:' + '|'.join(re.escape(city) for city in self.CITIES) + r')\b',
+            re.IGNORECASE
+        )
 
         # Compile patterns for provinces
         self.province_patterns = [
@@ -76,11 +79,23 @@ class CanadianFilter:
             for prov in self.PROVINCES
         ]
 
-        # Special patterns for province codes (case-sensitive to avoid matching "on", "in", etc.)
-        self.province_code_patterns = [
-            re.compile(r'\b' + code + r'\b')  # No IGNORECASE - must match uppercase ON, QC, BC, etc.
-            for code in self.PROVINCE_CODES
-        ]
+        # Single pattern for province codes (case-sensitive to avoid matching "on", "in", etc.)
+        # No IGNORECASE - must match uppercase ON, QC, BC, etc.
+        self.province_code_regex = re.compile(r'\b(?:' + '|'.join(self.PROVINCE_CODES) + r')\b')
+
+        # Single-pass matcher for Canadian keywords
+        self.keyword_matcher = KeywordMatcher(self.KEYWORDS)
+
+        # Subreddit -> filter route, so each post needs a single dict lookup
+        # (pet subreddits take precedence, matching filter_by_subreddit)
+        self.subreddit_routes = dict.fromkeys(self.CANADIAN_SUBREDDITS, 'canadian')
+        self.subreddit_routes.update(dict.fromkeys(self.PET_SUBREDDITS, 'pet'))
+
+        # One word-boundary alternation over all pet keywords (scans text once)
+        self.pet_keyword_regex = re.compile(
+            r'\b(?:' + '|'.join(re.escape(kw) for kw in self.PET_KEYWORDS) + r')\b',
+            re.IGNORECASE
+        )
 
     def calculate_canadian_score(self, text: str) -> float:
         """
@@ -103,13 +118,11 @@ class CanadianFilter:
             return 0.0
 
         score = 0.0
-        text_lower = text.lower()
 
         # 1. City mentions (0.3 points each, max 0.5)
-        city_matches = sum(
-            1 for pattern in self.city_patterns
-            if pattern.search(text)
-        )
+        city_matches = len({
+            match.group().lower() for match in self.city_regex.finditer(text)
+        })
         score += min(city_matches * 0.3, 0.5)
 
         # 2. Province mentions (0.2 points each, max 0.3)
@@ -118,18 +131,14 @@ class CanadianFilter:
             if pattern.search(text)
         )
         # Also check province codes
-        province_code_matches = sum(
-            1 for pattern in self.province_code_patterns
-            if pattern.search(text)
-        )
+        province_code_matches = len({
+            match.group() for match in self.province_code_regex.finditer(text)
+        })
         total_province_matches = province_matches + province_code_matches
         score += min(total_province_matches * 0.2, 0.3)
 
         # 3. Canadian keywords (0.15 points each, max 0.3)
-        keyword_matches = sum(
-            1 for keyword in self.KEYWORDS
-            if keyword in text_lower
-        )
+        keyword_matches = self.keyword_matcher.count_distinct(text)
         score += min(keyword_matches * 0.15, 0.3)
 
         # 4. Postal code (0.2 points)
@@ -195,13 +204,11 @@ class CanadianFilter:
 
     # Pet keywords (same as news_scraper.py)
     PET_KEYWORDS = [
-        'dog', 'dogs', 'puppy', 'puppies', 'canine',
-        'cat', 'cats', 'kitten', 'kittens', 'feline',
-        'pet', 'pets', 'animal', 'animals',
-        'veterinary', 'vet', 'veterinarian',
-        'rescue', 'shelter', 'adoption',
-        'paw', 'tail', 'fur', 'breed',
-        'collar', 'leash',
+        'dog', 'cat', 'pet', 'animal', 'puppy', 'vet',
+        'rescue', 'shelter', 'dogs', 'cats', 'pets', 'animals',
+        'kitten', 'puppies', 'adoption', 'veterinary', 'veterinarian',
+        'kittens', 'canine', 'feline', 'breed',
+        'paw', 'tail', 'fur', 'collar', 'leash',
     ]
 
     # Sports teams with animal names to exclude (false positives)
@@ -235,38 +242,49 @@ class CanadianFilter:
             # Strict mode: For Canadian city subreddits to avoid false positives like "Cat's Coffee"
             # Require: Pet keyword in TITLE or multiple pet keywords total
 
-            # Check if title has pet keywords
-            title_matches = 0
-            for keyword in self.PET_KEYWORDS:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, title, re.IGNORECASE):
-                    title_matches += 1
-
             # If title has pet keywords, it's clearly about pets
-            if title_matches > 0:
+            if self.pet_keyword_regex.search(title):
                 return True
 
             # Otherwise, check if there are multiple pet keywords in the full text
             # (to avoid matching "Cat's Coffee and Cake" as a pet post)
-            total_matches = 0
-            searchable_text = f"{title} {selftext}"
-            for keyword in self.PET_KEYWORDS:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, searchable_text, re.IGNORECASE):
-                    total_matches += 1
+            # Text is lowercased, so each match is the keyword itself
+            distinct_matches = set()
+            for match in self.pet_keyword_regex.finditer(searchable_text):
+                distinct_matches.add(match.group())
+                # Need at least 2 pet keywords if none are in title
+                if len(distinct_matches) >= 2:
+                    return True
 
-            # Need at least 2 pet keywords if none are in title
-            return total_matches >= 2
+            return False
 
         else:
             # Loose mode: Any pet keyword anywhere
-            searchable_text = f"{title} {selftext}"
-            for keyword in self.PET_KEYWORDS:
-                pattern = r'\b' + re.escape(keyword) + r'\b'
-                if re.search(pattern, searchable_text, re.IGNORECASE):
-                    return True
+            return self.pet_keyword_regex.search(searchable_text) is not None
 
-            return False
+    # Subreddits whose posts are Canadian by definition (need pet filter only)
+    CANADIAN_SUBREDDITS = frozenset({
+        # National
+        'canada', 'onguardforthee',
+
+        # Provinces/regions
+        'britishcolumbia', 'ontario', 'quebec', 'alberta',
+
+        # Major cities
+        'toronto', 'vancouver', 'montreal', 'calgary', 'ottawa',
+        'edmonton', 'winnipeg',
+
+        # Additional cities (15 more)
+        'halifax', 'victoriabc', 'saskatoon', 'regina',
+        'kingstonontario', 'londonontario', 'guelph', 'barrie', 'kelowna',
+        'waterloo', 'windsorontario', 'hamilton', 'kitchener', 'stjohnsnl'
+    })
+
+    # Subreddits whose posts are pet-related by definition (need Canadian filter only)
+    PET_SUBREDDITS = frozenset({
+        'dogs', 'puppy101', 'dogtraining', 'cats', 'catadvice',
+        'pets', 'aww',
+    })
 
     def filter_by_subreddit(self, posts: List[Dict]) -> List[Dict]:
         """
@@ -282,36 +300,19 @@ class CanadianFilter:
         Returns:
             Filtered list of Canadian-relevant AND pet-related posts
         """
-        canadian_subreddits = {
-            # National
-            'canada', 'onguardforthee',
-
-            # Provinces/regions
-            'britishcolumbia', 'ontario', 'quebec', 'alberta',
-
-            # Major cities
-            'toronto', 'vancouver', 'montreal', 'calgary', 'ottawa',
-            'edmonton', 'winnipeg',
-
-            # Additional cities (15 more)
-            'halifax', 'victoriabc', 'saskatoon', 'regina',
-            'kingstonontario', 'londonontario', 'guelph', 'barrie', 'kelowna',
-            'waterloo', 'windsorontario', 'hamilton', 'kitchener', 'stjohnsnl'
-        }
-
-        pet_subreddits = {
-            'dogs', 'puppy101', 'dogtraining', 'cats', 'catadvice',
-            'pets', 'aww',
-        }
+        subreddit_routes = self.subreddit_routes
+        is_canadian = self.is_canadian
+        is_pet_related = self._is_pet_related
 
         filtered_posts = []
 
         for post in posts:
             subreddit = post.get('subreddit', '').lower()
+            route = subreddit_routes.get(subreddit)
 
             # Pet subreddits: Check for Canadian relevance only
-            if subreddit in pet_subreddits:
-                if self.is_canadian(post, threshold=0.45):
+            if route == 'pet':
+                if is_canadian(post, threshold=0.45):
                     filtered_posts.append(post)
                     logger.debug(
                         f"Canadian pet post r/{subreddit} "
@@ -319,9 +320,9 @@ class CanadianFilter:
                     )
 
             # Canadian subreddits: Must be PET-related!
-            elif subreddit in canadian_subreddits:
+            elif route == 'canadian':
                 # Use strict=True to avoid false positives like "Cat's Coffee"
-                if self._is_pet_related(post, strict=True):
+                if is_pet_related(post, strict=True):
                     post['canadian_score'] = 1.0  # Max score (it's from Canadian subreddit)
                     filtered_posts.append(post)
                     logger.debug(f"Pet post from r/{subreddit}: {post['title'][:50]}")
@@ -330,7 +331,7 @@ class CanadianFilter:
 
             # Other subreddits: Need both Canadian AND pet signals
             else:
-                if self.is_canadian(post, threshold=0.3) and self._is_pet_related(post):
+                if is_canadian(post, threshold=0.3) and is_pet_related(post):
                     filtered_posts.append(post)
                     logger.debug(
                         f"Canadian pet post r/{subreddit} "
@@ -376,6 +377,8 @@ class CanadianFilter:
 
 # Example usage and testing
 if __name__ == '__main__':
+    # Demo: run from the project root as `python -m processors.canadian_filter`
+    # so the processors package is importable.
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
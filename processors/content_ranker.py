@@ -5,7 +5,8 @@ Calculates trending scores for Reddit posts and news articles.
 
 from datetime import datetime, timezone
 import math
-from typing import List, Dict
+from operator import itemgetter
+from typing import List, Dict, Optional
 import logging
 from dateutil import parser as date_parser
 
@@ -22,7 +23,10 @@ class ContentRanker:
     - Canadian relevance boost
     """
 
-    def calculate_reddit_score(self, post: Dict) -> float:
+    # News outlets that get a credibility boost
+    MAJOR_SOURCES = ('CBC', 'CTV', 'Global News', 'Toronto Star', 'Globe and Mail')
+
+    def calculate_reddit_score(self, post: Dict, now: Optional[datetime] = None) -> float:
         """
         Calculate trending score for Reddit post.
 
@@ -34,6 +38,7 @@ class ContentRanker:
 
         Args:
             post: Reddit post dictionary
+            now: Reference time for age calculation (defaults to current UTC time)
 
         Returns:
             Trending score (typically 0-10 range)
@@ -48,8 +53,9 @@ class ContentRanker:
         engagement = (score * 1.0) + (comments * 2.0)
 
         # 2. Time decay
-        now = datetime.now(timezone.utc).timestamp()
-        age_hours = (now - created_utc) / 3600 if created_utc > 0 else 999
+        if now is None:
+            now = datetime.now(timezone.utc)
+        age_hours = (now.timestamp() - created_utc) / 3600 if created_utc > 0 else 999
 
         # Decay multiplier based on age
         if age_hours < 6:
@@ -71,7 +77,7 @@ class ContentRanker:
 
         return round(trending_score, 3)
 
-    def calculate_news_score(self, article: Dict) -> float:
+    def calculate_news_score(self, article: Dict, now: Optional[datetime] = None) -> float:
         """
         Calculate trending score for news article.
 
@@ -83,10 +89,14 @@ class ContentRanker:
 
         Args:
             article: News article dictionary
+            now: Reference time for age calculation (defaults to current UTC time)
 
         Returns:
             Trending score (typically 1-15 range)
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         published = article.get('published', '')
         source = article.get('source', '')
         canadian_score = article.get('canadian_score', 0.0)
@@ -94,18 +104,22 @@ class ContentRanker:
         # 1. Parse published date
         try:
             if isinstance(published, str):
-                published_dt = date_parser.isoparse(published)
+                # Scrapers write datetime.isoformat() output, which the C-level
+                # fromisoformat parses directly; dateutil handles other forms
+                try:
+                    published_dt = datetime.fromisoformat(published)
+                except ValueError:
+                    published_dt = date_parser.isoparse(published)
             else:
-                published_dt = datetime.now(timezone.utc)
+                published_dt = now
         except (ValueError, TypeError):
-            published_dt = datetime.now(timezone.utc)
+            published_dt = now
 
         # Make timezone-aware if needed
         if published_dt.tzinfo is None:
             published_dt = published_dt.replace(tzinfo=timezone.utc)
 
         # 2. Time decay (news expires faster)
-        now = datetime.now(timezone.utc)
         age_hours = (now - published_dt).total_seconds() / 3600
 
         if age_hours < 6:
@@ -118,8 +132,7 @@ class ContentRanker:
             time_multiplier = 0.1  # Older news
 
         # 3. Source credibility
-        major_sources = ['CBC', 'CTV', 'Global News', 'Toronto Star', 'Globe and Mail']
-        source_boost = 1.3 if any(s in source for s in major_sources) else 1.0
+        source_boost = 1.3 if any(s in source for s in self.MAJOR_SOURCES) else 1.0
 
         # 4. Canadian boost
         canadian_boost = 1.0 + (canadian_score * 0.5)
@@ -146,24 +159,24 @@ class ContentRanker:
         """
         all_content = []
 
+        # One reference time for the whole batch
+        now = datetime.now(timezone.utc)
+
         # Score Reddit posts
         for post in reddit_posts:
-            post['trending_score'] = self.calculate_reddit_score(post)
+            post['trending_score'] = self.calculate_reddit_score(post, now)
             post['content_type'] = 'reddit'
             all_content.append(post)
 
         # Score news articles
         for article in news_articles:
-            article['trending_score'] = self.calculate_news_score(article)
+            article['trending_score'] = self.calculate_news_score(article, now)
             article['content_type'] = 'news'
             all_content.append(article)
 
-        # Sort by trending score (descending)
-        ranked_content = sorted(
-            all_content,
-            key=lambda x: x['trending_score'],
-            reverse=True
-        )
+        # Sort by trending score (descending), in place with a C-level key
+        all_content.sort(key=itemgetter('trending_score'), reverse=True)
+        ranked_content = all_content
 
         logger.info(
             f"Ranked {len(ranked_content)} total items "
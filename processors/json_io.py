@@ -0,0 +1,82 @@
+"""
+JSON file reading, parsing and writing for Canadian Pet Pulse.
+Uses orjson when installed and falls back to the standard library.
+"""
+
+import io
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional dependency
+    orjson = None
+
+# Write buffer size (1 MiB) so large candidate files hit disk in few syscalls
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def parse_json(content: bytes) -> Any:
+    """
+    Parse a JSON document from raw bytes (e.g. an HTTP response body).
+
+    Parsing the bytes directly skips decoding the body to str first.
+
+    Args:
+        content: UTF-8 encoded JSON document
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        ValueError: If the content is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def read_json(filepath: str) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Args:
+        filepath: Path to JSON file
+
+    Returns:
+        Parsed JSON data
+
+    Raises:
+        ValueError: If the file is not valid JSON (json.JSONDecodeError or
+            orjson.JSONDecodeError, which subclasses it)
+    """
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(filepath: str, data: Any, indent: bool = True):
+    """
+    Write data to a JSON file through a large write buffer.
+
+    Args:
+        filepath: Path to output JSON file
+        data: JSON-serializable data
+        indent: Pretty-print with 2-space indentation (for human review)
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        with open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+            f.write(orjson.dumps(data, option=option))
+        return
+
+    # Fallback: stream stdlib encoder output through the same buffered file
+    raw_file = open(filepath, 'wb', buffering=WRITE_BUFFER_SIZE)
+    with io.TextIOWrapper(raw_file, encoding='utf-8') as f:
+        if indent:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
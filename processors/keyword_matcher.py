@@ -0,0 +1,68 @@
+"""
+Multi-keyword substring matcher for Canadian Pet Pulse.
+Uses an Aho-Corasick automaton (pyahocorasick) when installed so each text is
+scanned once regardless of keyword count, and falls back to substring checks.
+"""
+
+from typing import Iterable
+
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """
+    Case-insensitive substring matcher over a fixed keyword list.
+
+    Matching semantics are identical to ``keyword in text.lower()`` for each
+    keyword; only the scan strategy differs.
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Build the matcher.
+
+        Args:
+            keywords: Keywords to match (lowercased before use)
+        """
+        self.keywords = tuple(dict.fromkeys(kw.lower() for kw in keywords))
+
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def contains_any(self, text: str) -> bool:
+        """
+        Check whether any keyword occurs in text (stops at first hit).
+
+        Args:
+            text: Text to search
+
+        Returns:
+            True if at least one keyword is found
+        """
+        text_lower = text.lower()
+        if self._automaton is not None:
+            return next(self._automaton.iter(text_lower), None) is not None
+        return any(keyword in text_lower for keyword in self.keywords)
+
+    def count_distinct(self, text: str) -> int:
+        """
+        Count how many distinct keywords occur in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Number of distinct keywords found
+        """
+        text_lower = text.lower()
+        if self._automaton is not None:
+            return len({keyword for _, keyword in self._automaton.iter(text_lower)})
+        return sum(1 for keyword in self.keywords if keyword in text_lower)
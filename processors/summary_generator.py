@@ -7,12 +7,20 @@ import os
 import logging
 from typing import List, Dict, Optional
 
+from processors.canadian_filter import CanadianFilter
+
 logger = logging.getLogger(__name__)
 
 
 class SummaryGenerator:
     """Generate AI summaries of daily pet content."""
 
+    # Canadian subreddits whose posts feed the summary (shared with the filter)
+    CANADIAN_SUBREDDITS = CanadianFilter.CANADIAN_SUBREDDITS
+
+    # Cat/dog keywords a summarized post must have in its title
+    PET_KEYWORDS = ('dog', 'dogs', 'puppy', 'puppies', 'cat', 'cats', 'kitten', 'kittens', 'pet', 'pets')
+
     def __init__(self, api_key: Optional[str] = None):
         """
         Initialize summary generator.
@@ -33,17 +41,8 @@ class SummaryGenerator:
         Returns:
             Filtered list suitable for summarization
         """
-        canadian_subreddits = {
-            'canada', 'onguardforthee',
-            'toronto', 'vancouver', 'montreal', 'calgary', 'ottawa',
-            'edmonton', 'winnipeg', 'halifax', 'victoriabc', 'saskatoon',
-            'regina', 'kingstonontario', 'londonontario', 'guelph',
-            'barrie', 'kelowna', 'waterloo', 'windsorontario', 'hamilton',
-            'kitchener', 'stjohnsnl', 'quebec', 'britishcolumbia',
-            'ontario', 'alberta'
-        }
-
-        pet_keywords = ['dog', 'dogs', 'puppy', 'puppies', 'cat', 'cats', 'kitten', 'kittens', 'pet', 'pets']
+        canadian_subreddits = self.CANADIAN_SUBREDDITS
+        pet_keywords = self.PET_KEYWORDS
 
         filtered = []
         for item in content:
@@ -248,6 +247,8 @@ Preview: {title_short} — see what's happening in your area.
 
 # Example usage
 if __name__ == '__main__':
+    # Demo: run from the project root as `python -m processors.summary_generator`
+    # so the processors package is importable.
     logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
     # Mock data
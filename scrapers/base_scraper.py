@@ -10,11 +10,50 @@ from functools import wraps
 
 logger = logging.getLogger(__name__)
 
+MAX_RETRY_AFTER = 60  # cap (seconds) on how long a server-requested wait can stall us
+
+
+def is_client_error(exc: Exception) -> bool:
+    """
+    Check whether an exception carries a 4xx HTTP response other than 429.
+
+    Such errors (404, 410, 403, ...) will not go away on retry, while
+    429 Too Many Requests is worth retrying after a back-off.
+
+    Args:
+        exc: Exception raised by the wrapped operation
+
+    Returns:
+        True if the error should not be retried
+    """
+    status = getattr(getattr(exc, 'response', None), 'status_code', None)
+    return status is not None and 400 <= status < 500 and status != 429
+
+
+def retry_after_seconds(exc: Exception) -> Optional[float]:
+    """
+    Read the Retry-After header (in seconds) from a failed HTTP response.
+
+    Args:
+        exc: Exception raised by the wrapped operation
+
+    Returns:
+        Requested wait capped at MAX_RETRY_AFTER, or None if not given
+    """
+    response = getattr(exc, 'response', None)
+    retry_after = response.headers.get('Retry-After', '') if response is not None else ''
+    if not retry_after.isdigit():
+        return None
+    return min(int(retry_after), MAX_RETRY_AFTER)
+
 
 def retry_on_failure(max_retries: int = 3, delay: float = 5.0):
     """
     Decorator to retry failed operations with exponential backoff.
 
+    HTTP client errors (4xx except 429) are re-raised immediately, and a
+    Retry-After header on the failed response replaces the backoff delay.
+
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay in seconds (doubles with each retry)
@@ -33,6 +72,8 @@ def retry_on_failure(max_retries: int = 3, delay: float = 5.0):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
+                    if is_client_error(e):
+                        raise
                     last_exception = e
                     logger.warning(
                         f"{func.__name__} attempt {attempt + 1}/{max_retries} failed: {e}"
@@ -40,7 +81,9 @@ def retry_on_failure(max_retries: int = 3, delay: float = 5.0):
 
                     # Don't sleep after the last failed attempt
                     if attempt < max_retries - 1:
-                        sleep_time = delay * (2 ** attempt)  # Exponential backoff
+                        sleep_time = retry_after_seconds(e)
+                        if sleep_time is None:
+                            sleep_time = delay * (2 ** attempt)  # Exponential backoff
                         logger.info(f"Retrying in {sleep_time} seconds...")
                         time.sleep(sleep_time)
 
@@ -152,9 +195,6 @@ class BaseScraper:
         if not text:
             return ""
 
-        # Replace multiple whitespace with single space
-        import re
-        text = re.sub(r'\s+', ' ', text)
-
-        # Strip leading/trailing whitespace
-        return text.strip()
+        # Collapse whitespace runs and strip the ends in one pass
+        # (str.split() splits on the same characters as regex \s)
+        return ' '.join(text.split())
@@ -5,12 +5,19 @@ Uses RSS feeds to collect pet-related articles.
 
 import feedparser
 import requests
-import json
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'  # C parser, much faster for summary cleanup
+except ImportError:  # Optional dependency
+    HTML_PARSER = 'html.parser'
+
+from processors.json_io import write_json
 from scrapers.base_scraper import retry_on_failure, BaseScraper
 
 logger = logging.getLogger(__name__)
@@ -34,15 +41,13 @@ class NewsScraper(BaseScraper):
         'Google News - Pets Canada': 'https://news.google.com/rss/search?q=pets+canada&hl=en-CA&gl=CA&ceid=CA:en',
     }
 
-    # Pet-related keywords for filtering
+    # Pet-related keywords for filtering (most common first so any() exits early)
     PET_KEYWORDS = [
-        'dog', 'dogs', 'puppy', 'puppies', 'canine',
-        'cat', 'cats', 'kitten', 'kittens', 'feline',
-        'pet', 'pets', 'animal', 'animals',
-        'veterinary', 'vet', 'veterinarian',
-        'rescue', 'shelter', 'adoption',
-        'paw', 'tail', 'fur', 'breed',
-        'collar', 'leash',
+        'dog', 'cat', 'pet', 'animal', 'puppy', 'vet',
+        'rescue', 'shelter', 'dogs', 'cats', 'pets', 'animals',
+        'kitten', 'puppies', 'adoption', 'veterinary', 'veterinarian',
+        'kittens', 'canine', 'feline', 'breed',
+        'paw', 'tail', 'fur', 'collar', 'leash',
     ]
 
     # Sports teams with animal names to exclude (false positives)
@@ -51,37 +56,81 @@ class NewsScraper(BaseScraper):
         'blue jays',  # Toronto MLB team
     ]
 
-    def __init__(self):
-        """Initialize news scraper."""
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None):
+        """
+        Initialize news scraper.
+
+        Args:
+            session: Shared HTTP session to reuse connections (default: new session)
+        """
+        self.session = session or requests.Session()
         self.session.headers.update({'User-Agent': self.USER_AGENT})
 
     @retry_on_failure(max_retries=3, delay=5.0)
-    def scrape_rss_feed(self, feed_url: str, source_name: str) -> List[Dict]:
+    def scrape_rss_feed(self, feed_url: str, source_name: str,
+                        timeout: float = 10) -> List[Dict]:
         """
         Scrape and parse an RSS feed, filtering for pet-related content.
 
         Args:
             feed_url: URL of the RSS feed
             source_name: Display name for the source
+            timeout: Request timeout in seconds
 
         Returns:
             List of pet-related article dictionaries
+
+        Raises:
+            requests.RequestException: If request fails after retries
         """
         logger.info(f"Scraping RSS feed: {source_name}")
 
-        # Parse feed with user agent
-        feed = feedparser.parse(feed_url, agent=self.USER_AGENT)
+        # Fetch with the session (user agent + per-request timeout), then parse
+        response = self.session.get(feed_url, timeout=timeout)
+        response.raise_for_status()
+
+        # feedparser looks headers up by lowercase name
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        return self.parse_rss_feed(response.content, source_name, response_headers=headers)
+
+    def parse_rss_feed(self, feed_content: bytes, source_name: str,
+                       response_headers: Optional[Dict[str, str]] = None) -> List[Dict]:
+        """
+        Parse already-downloaded RSS feed content, filtering for pet-related content.
+
+        Args:
+            feed_content: Raw RSS/Atom document
+            source_name: Display name for the source
+            response_headers: HTTP headers the feed was served with, keyed by
+                lowercase name (lets feedparser honour the Content-Type charset)
+
+        Returns:
+            List of pet-related article dictionaries
+        """
+        feed = feedparser.parse(feed_content, response_headers=response_headers)
+        return self._extract_pet_articles(feed, source_name)
+
+    def _extract_pet_articles(self, feed, source_name: str) -> List[Dict]:
+        """
+        Extract pet-related articles from a parsed feed.
 
+        Args:
+            feed: feedparser result object
+            source_name: Display name for the source
+
+        Returns:
+            List of pet-related article dictionaries
+        """
         if not feed.entries:
             logger.warning(f"No entries found in {source_name}")
             return []
 
         # Filter for pet-related content
         articles = []
+        now = datetime.now(timezone.utc)
         for entry in feed.entries:
             if self._is_pet_related(entry):
-                article = self._extract_article_data(entry, source_name)
+                article = self._extract_article_data(entry, source_name, now)
                 articles.append(article)
 
         logger.info(f"Found {len(articles)} pet-related articles from {source_name}")
@@ -97,16 +146,12 @@ class NewsScraper(BaseScraper):
         Returns:
             True if article is pet-related
         """
-        # Combine title and summary for searching
-        title = entry.get('title', '').lower()
-        summary = entry.get('summary', '').lower()
-
-        # Extract tags if available
-        tags = ' '.join([tag.get('term', '').lower()
-                        for tag in entry.get('tags', [])])
+        # Combine title, summary and tags, lowercasing the result once
+        title = entry.get('title', '')
+        summary = entry.get('summary', '')
+        tags = ' '.join([tag.get('term', '') for tag in entry.get('tags', [])])
 
-        # Combine all searchable text
-        searchable_text = f"{title} {summary} {tags}"
+        searchable_text = f"{title} {summary} {tags}".lower()
 
         # Exclude sports teams with animal names
         for team in self.SPORTS_TEAM_EXCLUSIONS:
@@ -116,26 +161,31 @@ class NewsScraper(BaseScraper):
         # Check if any pet keyword appears
         return any(keyword in searchable_text for keyword in self.PET_KEYWORDS)
 
-    def _extract_article_data(self, entry, source_name: str) -> Dict:
+    def _extract_article_data(self, entry, source_name: str,
+                              now: Optional[datetime] = None) -> Dict:
         """
         Extract relevant fields from RSS entry.
 
         Args:
             entry: feedparser entry object
             source_name: Name of the news source
+            now: Scrape time shared by the batch (defaults to current UTC time)
 
         Returns:
             Dictionary with article data
         """
+        if now is None:
+            now = datetime.now(timezone.utc)
+
         # Parse published date
         published_parsed = entry.get('published_parsed')
         if published_parsed:
             try:
                 published_dt = datetime(*published_parsed[:6], tzinfo=timezone.utc)
             except (TypeError, ValueError):
-                published_dt = datetime.now(timezone.utc)
+                published_dt = now
         else:
-            published_dt = datetime.now(timezone.utc)
+            published_dt = now
 
         # Clean HTML from summary
         summary = self._clean_html(entry.get('summary', ''))
@@ -149,7 +199,7 @@ class NewsScraper(BaseScraper):
             'source': source_name,
             'author': entry.get('author', ''),
             'tags': [tag.get('term', '') for tag in entry.get('tags', [])],
-            'scraped_at': datetime.now(timezone.utc).isoformat(),
+            'scraped_at': now.isoformat(),
         }
 
     def _clean_html(self, html_text: str) -> str:
@@ -166,19 +216,25 @@ class NewsScraper(BaseScraper):
             return ''
 
         try:
-            soup = BeautifulSoup(html_text, 'html.parser')
+            soup = BeautifulSoup(html_text, HTML_PARSER)
             text = soup.get_text(separator=' ', strip=True)
             return self.clean_whitespace(text)
         except Exception as e:
             logger.warning(f"Error cleaning HTML: {e}")
             return html_text
 
-    def scrape_all(self, feeds: Optional[Dict[str, str]] = None) -> List[Dict]:
+    def scrape_all(self, feeds: Optional[Dict[str, str]] = None,
+                   max_workers: int = 4, timeout: int = 10) -> List[Dict]:
         """
-        Scrape all configured news sources.
+        Scrape all configured news sources concurrently.
+
+        Feeds live on different hosts, so a small thread pool overlaps their
+        network waits; results are still collected in feed order.
 
         Args:
             feeds: Dictionary of {source_name: feed_url} (uses default if None)
+            max_workers: Maximum number of feeds fetched at once
+            timeout: Request timeout per feed in seconds
 
         Returns:
             List of all articles from all sources
@@ -191,16 +247,24 @@ class NewsScraper(BaseScraper):
 
         logger.info(f"Starting scrape of {len(feeds)} news sources")
 
-        for i, (source_name, feed_url) in enumerate(feeds.items(), 1):
+        def scrape_feed(item):
+            source_name, feed_url = item
             try:
-                articles = self.scrape_rss_feed(feed_url, source_name)
-                all_articles.extend(articles)
+                return self.scrape_rss_feed(feed_url, source_name, timeout=timeout), None
+            except Exception as e:
+                return None, e
 
-                logger.info(f"[{i}/{len(feeds)}] {source_name}: {len(articles)} articles")
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(feeds)))) as executor:
+            results = executor.map(scrape_feed, feeds.items())
 
-            except Exception as e:
-                logger.error(f"Failed to scrape {source_name}: {e}")
-                failed_sources.append(source_name)
+            for i, (source_name, (articles, error)) in enumerate(zip(feeds, results), 1):
+                if error is not None:
+                    logger.error(f"Failed to scrape {source_name}: {error}")
+                    failed_sources.append(source_name)
+                    continue
+
+                all_articles.extend(articles)
+                logger.info(f"[{i}/{len(feeds)}] {source_name}: {len(articles)} articles")
 
         # Summary
         success_count = len(feeds) - len(failed_sources)
@@ -230,8 +294,7 @@ class NewsScraper(BaseScraper):
             'articles': articles
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        write_json(filepath, output)
 
         logger.info(f"Saved {len(articles)} articles to {filepath}")
 
@@ -5,12 +5,12 @@ Collects trending posts from pet and Canadian subreddits.
 
 import requests
 import time
-import json
 from datetime import datetime, timezone
 from typing import List, Dict, Optional
 import logging
 
-from scrapers.base_scraper import retry_on_failure, BaseScraper
+from processors.json_io import parse_json, write_json
+from scrapers.base_scraper import MAX_RETRY_AFTER, retry_on_failure, BaseScraper
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ class RedditScraper(BaseScraper):
 
     BASE_URL = "https://www.reddit.com"
     USER_AGENT = "CanadianPetPulse/0.1.0 (Educational Project; Pet Content Aggregator)"
-    RATE_LIMIT_DELAY = 2  # seconds between requests
+    RATE_LIMIT_DELAY = 2  # seconds between requests (minimum)
 
     # Target subreddits
     SUBREDDITS = [
@@ -47,19 +47,25 @@ class RedditScraper(BaseScraper):
         'onguardforthee',
     ]
 
-    def __init__(self, rate_limit_delay: float = None):
+    def __init__(self, rate_limit_delay: float = None,
+                 session: Optional[requests.Session] = None):
         """
         Initialize Reddit scraper.
 
         Args:
             rate_limit_delay: Seconds to wait between requests (default: 2)
+            session: Shared HTTP session to reuse connections (default: new session)
         """
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         self.session.headers.update({'User-Agent': self.USER_AGENT})
 
         if rate_limit_delay is not None:
             self.RATE_LIMIT_DELAY = rate_limit_delay
 
+        # Rate-limit budget reported by Reddit on the last response
+        self.ratelimit_remaining = None
+        self.ratelimit_reset = None
+
     @retry_on_failure(max_retries=3, delay=5.0)
     def scrape_subreddit(self, subreddit: str, time_filter: str = 'day',
                          limit: int = 25) -> List[Dict]:
@@ -86,29 +92,79 @@ class RedditScraper(BaseScraper):
         logger.info(f"Scraping r/{subreddit} (limit={limit}, time={time_filter})")
 
         response = self.session.get(url, params=params, timeout=10)
+        self._update_rate_limit(response)
+
+        # A 429 is retried by the decorator, which honours its Retry-After
         response.raise_for_status()
 
-        data = response.json()
+        # Parse the raw (already gunzipped) body without decoding it to str first
+        data = parse_json(response.content)
 
         # Extract posts from Reddit API response
         posts = []
         children = self.safe_get(data, 'data', 'children', default=[])
 
+        # One timestamp for the whole batch
+        scraped_at = datetime.now(timezone.utc).isoformat()
+
         for child in children:
             post_data = child.get('data', {})
             if post_data:
-                posts.append(self._extract_post_data(post_data, subreddit))
+                posts.append(self._extract_post_data(post_data, subreddit, scraped_at))
 
         logger.info(f"Retrieved {len(posts)} posts from r/{subreddit}")
         return posts
 
-    def _extract_post_data(self, post: Dict, subreddit: str) -> Dict:
+    def _update_rate_limit(self, response):
+        """
+        Record Reddit's rate-limit budget from response headers.
+
+        Args:
+            response: Response from a Reddit request
+        """
+        try:
+            self.ratelimit_remaining = float(response.headers['X-Ratelimit-Remaining'])
+            self.ratelimit_reset = float(response.headers['X-Ratelimit-Reset'])
+        except (KeyError, ValueError):
+            self.ratelimit_remaining = None
+            self.ratelimit_reset = None
+
+    def _rate_limit_delay(self, requests_left: int) -> float:
+        """
+        Seconds to wait before the next request.
+
+        Uses the fixed RATE_LIMIT_DELAY while Reddit's reported budget covers
+        the remaining requests, and spreads them out until the window resets
+        once it doesn't (never waiting longer than MAX_RETRY_AFTER).
+
+        Args:
+            requests_left: Number of requests still to make in this run
+
+        Returns:
+            Delay in seconds
+        """
+        delay = self.RATE_LIMIT_DELAY
+
+        if self.ratelimit_remaining is not None and self.ratelimit_remaining < requests_left:
+            budget_delay = self.ratelimit_reset / max(self.ratelimit_remaining, 1)
+            if budget_delay > delay:
+                delay = min(budget_delay, MAX_RETRY_AFTER)
+                logger.info(
+                    f"Rate-limit budget low ({self.ratelimit_remaining:.0f} requests left, "
+                    f"resets in {self.ratelimit_reset:.0f}s), waiting {delay:.1f}s"
+                )
+
+        return delay
+
+    def _extract_post_data(self, post: Dict, subreddit: str,
+                           scraped_at: Optional[str] = None) -> Dict:
         """
         Extract relevant fields from Reddit post.
 
         Args:
             post: Raw Reddit post data from API
             subreddit: Subreddit name (for validation)
+            scraped_at: ISO timestamp shared by the batch (defaults to now)
 
         Returns:
             Dictionary with cleaned post data
@@ -130,7 +186,7 @@ class RedditScraper(BaseScraper):
             'is_video': post.get('is_video', False),
             'domain': post.get('domain', ''),
             'link_flair_text': post.get('link_flair_text', ''),
-            'scraped_at': datetime.now(timezone.utc).isoformat(),
+            'scraped_at': scraped_at or datetime.now(timezone.utc).isoformat(),
         }
 
     def scrape_all(self, subreddits: Optional[List[str]] = None,
@@ -169,9 +225,10 @@ class RedditScraper(BaseScraper):
                 logger.error(f"Failed to scrape r/{subreddit}: {e}")
                 failed_subreddits.append(subreddit)
 
-            # Rate limiting - wait between requests (except after last one)
+            # Rate limiting - wait between requests (except after last one),
+            # slowing down if Reddit reports the budget is running out
             if i < len(subreddits):
-                time.sleep(self.RATE_LIMIT_DELAY)
+                time.sleep(self._rate_limit_delay(len(subreddits) - i))
 
         # Summary
         success_count = len(subreddits) - len(failed_subreddits)
@@ -201,8 +258,7 @@ class RedditScraper(BaseScraper):
             'posts': posts
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        write_json(filepath, output)
 
         logger.info(f"Saved {len(posts)} posts to {filepath}")
 
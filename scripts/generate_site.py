@@ -7,9 +7,10 @@ Runs pipeline, auto-approves top content, generates HTML.
 import sys
 import os
 from pathlib import Path
-from datetime import datetime
-import json
+from datetime import datetime, timezone
 import logging
+from collections import Counter
+from itertools import islice
 
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -19,6 +20,7 @@ from scrapers.reddit_scraper import RedditScraper
 from scrapers.news_scraper import NewsScraper
 from processors.canadian_filter import CanadianFilter
 from processors.content_ranker import ContentRanker
+from processors.json_io import write_json
 from processors.summary_generator import SummaryGenerator
 from generators.html_generator import HTMLGenerator
 
@@ -39,6 +41,9 @@ class AutomatedPipeline:
         self.processed_dir = self.data_dir / 'processed'
         self.docs_dir = PROJECT_ROOT / 'docs'
 
+        # Single date stamp for every file written by this run
+        self.today = datetime.now().strftime('%Y%m%d')
+
         # Ensure directories exist
         for dir_path in [self.data_dir, self.raw_dir, self.processed_dir, self.docs_dir]:
             dir_path.mkdir(exist_ok=True)
@@ -54,10 +59,10 @@ class AutomatedPipeline:
             reddit_posts, news_articles = self.scrape_content()
 
             # Step 2: Filter for Canadian pet content
-            canadian_content = self.filter_content(reddit_posts, news_articles)
+            canadian_reddit, canadian_news = self.filter_content(reddit_posts, news_articles)
 
             # Step 3: Rank by trending score
-            ranked_content = self.rank_content(canadian_content)
+            ranked_content = self.rank_content(canadian_reddit, canadian_news)
 
             # Step 4: Auto-approve top items
             approved_content = self.auto_approve(ranked_content)
@@ -66,9 +71,10 @@ class AutomatedPipeline:
             summary = self.generate_summary(approved_content)
 
             # Step 6: Generate HTML site
+            type_counts = Counter(c.get('content_type') for c in approved_content)
             stats = {
-                'reddit_posts': len([c for c in approved_content if c.get('content_type') == 'reddit']),
-                'news_articles': len([c for c in approved_content if c.get('content_type') == 'news']),
+                'reddit_posts': type_counts['reddit'],
+                'news_articles': type_counts['news'],
                 'total_items': len(approved_content),
                 'sources_succeeded': ['reddit', 'news'],
                 'sources_failed': [],
@@ -104,8 +110,7 @@ class AutomatedPipeline:
         reddit_posts = reddit_scraper.scrape_all(subreddits=subreddits, limit_per_sub=15)
 
         # Save raw Reddit data
-        today = datetime.now().strftime('%Y%m%d')
-        reddit_file = self.raw_dir / f'reddit_{today}.json'
+        reddit_file = self.raw_dir / f'reddit_{self.today}.json'
         reddit_scraper.save_to_json(reddit_posts, str(reddit_file))
 
         logger.info(f"✓ Reddit: {len(reddit_posts)} posts")
@@ -116,7 +121,7 @@ class AutomatedPipeline:
         try:
             news_articles = news_scraper.scrape_all()
             if news_articles:
-                news_file = self.raw_dir / f'news_{today}.json'
+                news_file = self.raw_dir / f'news_{self.today}.json'
                 news_scraper.save_to_json(news_articles, str(news_file))
         except Exception as e:
             logger.warning(f"News scraping failed: {e}")
@@ -126,7 +131,7 @@ class AutomatedPipeline:
         return reddit_posts, news_articles
 
     def filter_content(self, reddit_posts, news_articles):
-        """Filter for Canadian pet content."""
+        """Filter for Canadian pet content (returns Reddit and news lists separately)."""
         logger.info("STEP 2: Filtering content")
 
         canadian_filter = CanadianFilter()
@@ -139,17 +144,14 @@ class AutomatedPipeline:
         canadian_news = canadian_filter.filter_canadian_content(news_articles, threshold=0.45)
         logger.info(f"✓ News: {len(news_articles)} → {len(canadian_news)} Canadian articles")
 
-        return canadian_reddit + canadian_news
+        return canadian_reddit, canadian_news
 
-    def rank_content(self, content):
+    def rank_content(self, reddit_posts, news_articles):
         """Rank content by trending score."""
         logger.info("STEP 3: Ranking content")
 
         ranker = ContentRanker()
-        ranked = ranker.rank_all_content(
-            [c for c in content if c.get('content_type') == 'reddit'],
-            [c for c in content if c.get('content_type') == 'news']
-        )
+        ranked = ranker.rank_all_content(reddit_posts, news_articles)
 
         logger.info(f"✓ Ranked {len(ranked)} items")
         return ranked
@@ -166,10 +168,10 @@ class AutomatedPipeline:
         logger.info("STEP 4: Auto-approving content")
 
         # Filter by minimum Canadian score (high threshold for quality)
-        quality_items = [c for c in candidates if c.get('canadian_score', 0) >= 0.45]
+        quality_items = (c for c in candidates if c.get('canadian_score', 0) >= 0.45)
 
-        # Take top 15 by trending score
-        approved = quality_items[:15]
+        # Take top 15 by trending score (stops scanning once 15 are found)
+        approved = list(islice(quality_items, 15))
 
         logger.info(f"✓ Auto-approved {len(approved)} items from {len(candidates)} candidates")
 
@@ -193,45 +195,34 @@ class AutomatedPipeline:
         """Generate final HTML site."""
         logger.info("STEP 6: Generating HTML")
 
-        today = datetime.now().strftime('%Y%m%d')
+        today = self.today
 
         # Save approved data
         approved_file = self.processed_dir / f'trending_approved_{today}.json'
-        with open(approved_file, 'w') as f:
-            json.dump({
-                'date': today,
-                'generated_at': datetime.utcnow().isoformat() + '+00:00',
-                'reviewed_at': datetime.now().strftime('%Y-%m-%d %I:%M %p'),
-                'stats': stats,
-                'content': content,
-                'review_metadata': {
-                    'method': 'auto-approved',
-                    'approved_count': len(content),
-                }
-            }, f, indent=2)
+        write_json(str(approved_file), {
+            'date': today,
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'reviewed_at': datetime.now().strftime('%Y-%m-%d %I:%M %p'),
+            'stats': stats,
+            'content': content,
+            'review_metadata': {
+                'method': 'auto-approved',
+                'approved_count': len(content),
+            }
+        })
 
         # Generate HTML
         template_dir = PROJECT_ROOT / 'generators' / 'templates'
         generator = HTMLGenerator(str(template_dir), str(self.docs_dir))
 
-        # Main site
-        generator.generate_site(
-            trending_content=content,
-            stats=stats,
-            summary=summary
-        )
-
-        # Archive page
-        generator.generate_archive_page(
-            date=today,
+        # Main site, archive page and archive index
+        generator.generate_all(
             trending_content=content,
             stats=stats,
-            summary=summary
+            summary=summary,
+            date=today
         )
 
-        # Archive index
-        generator.generate_archive_index()
-
         logger.info(f"✓ Generated HTML site with {len(content)} items")
 
 
@@ -6,100 +6,203 @@ Allows editorial review of trending candidates before publishing.
 import json
 import os
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+try:
+    import ijson
+except ImportError:  # Optional: falls back to loading the whole file
+    ijson = None
+
+# Errors raised for malformed candidates files
+JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson else (json.JSONDecodeError,)
+
+# ijson events that open a value (one per item of the 'content' list)
+ITEM_START_EVENTS = ('start_map', 'start_array', 'string', 'number', 'boolean', 'null')
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
 
 from generators.html_generator import HTMLGenerator
+from processors.json_io import read_json, write_json
 from processors.summary_generator import SummaryGenerator
 
+# Directories
+PROCESSED_DIR = PROJECT_ROOT / 'data' / 'processed'
+TEMPLATE_DIR = PROJECT_ROOT / 'generators' / 'templates'
+DOCS_DIR = PROJECT_ROOT / 'docs'
+
+# Terminal banner lines
+SEPARATOR = "=" * 80
+DIVIDER = "-" * 80
+
+# Terminal preview of a single candidate (optional sections are pre-rendered)
+PREVIEW_TEMPLATE = (
+    "\n{separator}\n"
+    "ITEM {number} of {total}\n"
+    "{separator}\n"
+    "\n📰 TITLE: {title}\n"
+    "📍 SOURCE: {source}\n"
+    "🔥 TRENDING SCORE: {trending_score:.2f}\n"
+    "🍁 CANADIAN SCORE: {canadian_pct:.0f}%"
+    "{engagement}{preview}{link}\n"
+    "\n{divider}"
+)
+ENGAGEMENT_SECTION = "\n⬆️  ENGAGEMENT: {} upvotes | {} comments"
+PREVIEW_SECTION = "\n\n📝 PREVIEW:\n   {}..."
+LINK_SECTION = "\n\n🔗 LINK: {}"
+
+
+def format_rate(count: int, total: int) -> str:
+    """Format count/total as a percentage, treating an empty total as 0%."""
+    return f"{count / total * 100:.1f}%" if total else "0.0%"
+
+
+def prompt(message: str) -> Optional[str]:
+    """
+    Prompt for a one-line answer on stdout and read it from stdin.
+
+    Writes and reads the streams directly rather than going through
+    input(), which also flushes stderr on every call.
+
+    Args:
+        message: Prompt text
+
+    Returns:
+        Lowercased, stripped answer, or None at end of input
+    """
+    sys.stdout.write(message)
+    sys.stdout.flush()
+
+    line = sys.stdin.readline()
+    if not line:
+        return None
+
+    return line.strip().lower()
+
 
 class ContentReviewer:
     """Interactive CLI tool for reviewing and approving content."""
 
-    def __init__(self, candidates_file: str):
+    def __init__(self, candidates_file: str, template_dir: str = str(TEMPLATE_DIR)):
         """
         Initialize reviewer with candidates file.
 
         Args:
             candidates_file: Path to trending_candidates.json
+            template_dir: Directory containing Jinja2 templates
         """
         self.candidates_file = candidates_file
+        self.template_dir = template_dir
         self.candidates_data = None
+        self.total_candidates = 0
         self.approved_items = []
+        self.approved_data = None
 
     def load_candidates(self) -> bool:
-        """Load candidates from JSON file."""
+        """
+        Load candidates from JSON file.
+
+        With ijson installed, the file is validated and its items counted in
+        a single streaming pass, but only the metadata around the 'content'
+        list is kept; items are streamed later by iter_candidates().
+        """
         try:
-            with open(self.candidates_file, 'r') as f:
-                self.candidates_data = json.load(f)
+            if ijson is not None:
+                self.candidates_data, self.total_candidates = self._load_metadata()
+            else:
+                self.candidates_data = read_json(self.candidates_file)
+                self.total_candidates = len(self.candidates_data.get('content', []))
             return True
         except FileNotFoundError:
             print(f"❌ Candidates file not found: {self.candidates_file}")
             print("Run the pipeline first to generate candidates.")
             return False
-        except json.JSONDecodeError as e:
+        except JSON_ERRORS as e:
             print(f"❌ Invalid JSON in candidates file: {e}")
             return False
 
+    def _load_metadata(self) -> Tuple[Dict, int]:
+        """
+        Parse top-level fields of the candidates file and count its items.
+
+        Drains the whole event stream so that a truncated or corrupt file
+        fails here rather than in the middle of a review session.
+
+        Returns:
+            Tuple of (top-level fields without 'content', number of items)
+        """
+        metadata = {}
+        item_count = 0
+        key = builder = None
+
+        with open(self.candidates_file, 'rb') as f:
+            for prefix, event, value in ijson.parse(f, use_float=True):
+                if prefix == 'content.item':
+                    item_count += event in ITEM_START_EVENTS
+                elif prefix == '' and event in ('map_key', 'end_map'):
+                    if builder is not None:
+                        metadata[key] = builder.value
+                        builder = None
+                    if event == 'map_key' and value != 'content':
+                        key, builder = value, ijson.ObjectBuilder()
+                elif builder is not None:
+                    builder.event(event, value)
+
+        return metadata, item_count
+
+    def iter_candidates(self) -> Iterator[Dict]:
+        """
+        Iterate over candidate items, streaming them from disk when possible.
+
+        Returns:
+            Iterator of candidate content dictionaries
+        """
+        if ijson is None:
+            return iter(self.candidates_data.get('content', []))
+
+        return self._stream_content()
+
+    def _stream_content(self) -> Iterator[Dict]:
+        """Lazily parse items of the 'content' list with ijson."""
+        with open(self.candidates_file, 'rb') as f:
+            yield from ijson.items(f, 'content.item', use_float=True)
+
     def format_item_preview(self, item: Dict, index: int, total: int) -> str:
         """Format item for display in terminal."""
-        lines = []
-        lines.append("\n" + "=" * 80)
-        lines.append(f"ITEM {index + 1} of {total}")
-        lines.append("=" * 80)
+        get = item.get
+        content_type = get('content_type', 'unknown')
+        is_reddit = content_type == 'reddit'
 
-        # Title
-        lines.append(f"\n📰 TITLE: {item['title']}")
-
-        # Source
-        content_type = item.get('content_type', 'unknown')
-        if content_type == 'reddit':
+        # Source, preview text and link depend on content type
+        if is_reddit:
             source = f"r/{item['subreddit']}"
-        else:
-            source = item.get('source', 'Unknown')
-        lines.append(f"📍 SOURCE: {source}")
-
-        # Scores
-        canadian_score = item.get('canadian_score', 0.0)
-        trending_score = item.get('trending_score', 0.0)
-        lines.append(f"🔥 TRENDING SCORE: {trending_score:.2f}")
-        lines.append(f"🍁 CANADIAN SCORE: {canadian_score * 100:.0f}%")
-
-        # Engagement (Reddit only)
-        if content_type == 'reddit':
-            score = item.get('score', 0)
-            comments = item.get('num_comments', 0)
-            lines.append(f"⬆️  ENGAGEMENT: {score} upvotes | {comments} comments")
-
-        # Content preview
-        preview_text = ""
-        if content_type == 'reddit' and item.get('selftext'):
-            preview_text = item['selftext'][:200]
-        elif content_type == 'news' and item.get('summary'):
-            preview_text = item['summary'][:200]
-
-        if preview_text:
-            lines.append(f"\n📝 PREVIEW:")
-            lines.append(f"   {preview_text}...")
-
-        # Link
-        if content_type == 'reddit':
-            link = item.get('permalink', '')
+            preview_text = get('selftext')
+            link = get('permalink', '')
             if link and not link.startswith('http'):
                 link = f"https://www.reddit.com{link}"
+            engagement = ENGAGEMENT_SECTION.format(get('score', 0), get('num_comments', 0))
         else:
-            link = item.get('link', '')
-
-        if link:
-            lines.append(f"\n🔗 LINK: {link}")
-
-        lines.append("\n" + "-" * 80)
-
-        return "\n".join(lines)
+            source = get('source', 'Unknown')
+            preview_text = get('summary') if content_type == 'news' else None
+            link = get('link', '')
+            engagement = ''
+
+        return PREVIEW_TEMPLATE.format_map({
+            'separator': SEPARATOR,
+            'divider': DIVIDER,
+            'number': index + 1,
+            'total': total,
+            'title': item['title'],
+            'source': source,
+            'trending_score': get('trending_score', 0.0),
+            'canadian_pct': get('canadian_score', 0.0) * 100,
+            'engagement': engagement,
+            'preview': PREVIEW_SECTION.format(preview_text[:200]) if preview_text else '',
+            'link': LINK_SECTION.format(link) if link else '',
+        })
 
     def get_user_decision(self) -> str:
         """
@@ -112,7 +215,11 @@ class ContentReviewer:
             'q' = quit
         """
         while True:
-            response = input("\n👉 Include this item? (y=yes, n=no, s=skip to end, q=quit): ").lower().strip()
+            response = prompt("\n👉 Include this item? (y=yes, n=no, s=skip to end, q=quit): ")
+
+            # End of input (e.g. piped answers ran out): stop without saving
+            if response is None:
+                return 'q'
 
             if response in ['y', 'n', 's', 'q']:
                 return response
@@ -126,19 +233,23 @@ class ContentReviewer:
         Returns:
             List of approved items
         """
-        if not self.candidates_data:
+        # Streamed metadata may legitimately be empty ({"content": [...]})
+        if self.candidates_data is None:
             return []
 
-        content_items = self.candidates_data.get('content', [])
-        total_items = len(content_items)
+        content_items = self.iter_candidates()
+        total_items = self.total_candidates
 
-        print("\n" + "=" * 80)
+        print("\n" + SEPARATOR)
         print("🐾 CANADIAN PET PULSE - CONTENT REVIEW")
-        print("=" * 80)
+        print(SEPARATOR)
         print(f"\n📊 Total candidates: {total_items}")
         print("\nReview each item and decide whether to publish it.")
         print("Commands: y=approve, n=reject, s=skip to end, q=quit\n")
 
+        approved = self.approved_items
+        approve = approved.append
+
         for index, item in enumerate(content_items):
             # Show item preview
             preview = self.format_item_preview(item, index, total_items)
@@ -148,8 +259,8 @@ class ContentReviewer:
             decision = self.get_user_decision()
 
             if decision == 'y':
-                self.approved_items.append(item)
-                print(f"✅ Approved ({len(self.approved_items)} total)")
+                approve(item)
+                print(f"✅ Approved ({len(approved)} total)")
 
             elif decision == 'n':
                 print("❌ Rejected")
@@ -162,7 +273,7 @@ class ContentReviewer:
                 print("\n👋 Quitting review...")
                 return []
 
-        return self.approved_items
+        return approved
 
     def save_approved(self, output_file: str) -> bool:
         """
@@ -178,50 +289,67 @@ class ContentReviewer:
             print("\n⚠️  No items approved. Not saving.")
             return False
 
+        # Count content types in a single pass
+        reddit_count = news_count = 0
+        for item in self.approved_items:
+            content_type = item.get('content_type')
+            reddit_count += content_type == 'reddit'
+            news_count += content_type == 'news'
+
+        approved_count = len(self.approved_items)
+        total_candidates = self.total_candidates
+        candidate_stats = self.candidates_data.get('stats', {})
+
         # Create output data structure (same format as candidates)
         output_data = {
             'date': self.candidates_data.get('date'),
-            'generated_at': datetime.utcnow().isoformat() + '+00:00',
+            'generated_at': datetime.now(timezone.utc).isoformat(),
             'reviewed_at': datetime.now().strftime('%Y-%m-%d %I:%M %p'),
             'stats': {
-                'reddit_posts': sum(1 for item in self.approved_items if item.get('content_type') == 'reddit'),
-                'news_articles': sum(1 for item in self.approved_items if item.get('content_type') == 'news'),
-                'total_items': len(self.approved_items),
-                'sources_succeeded': self.candidates_data.get('stats', {}).get('sources_succeeded', []),
-                'sources_failed': self.candidates_data.get('stats', {}).get('sources_failed', []),
+                'reddit_posts': reddit_count,
+                'news_articles': news_count,
+                'total_items': approved_count,
+                'sources_succeeded': candidate_stats.get('sources_succeeded', []),
+                'sources_failed': candidate_stats.get('sources_failed', []),
             },
             'content': self.approved_items,
             'review_metadata': {
-                'total_candidates': len(self.candidates_data.get('content', [])),
-                'approved_count': len(self.approved_items),
-                'approval_rate': f"{len(self.approved_items) / len(self.candidates_data.get('content', [])) * 100:.1f}%",
+                'total_candidates': total_candidates,
+                'approved_count': approved_count,
+                'approval_rate': format_rate(approved_count, total_candidates),
             }
         }
 
         try:
-            with open(output_file, 'w') as f:
-                json.dump(output_data, f, indent=2)
-            print(f"\n✅ Saved {len(self.approved_items)} approved items to: {output_file}")
+            write_json(output_file, output_data)
+            self.approved_data = output_data
+            print(f"\n✅ Saved {approved_count} approved items to: {output_file}")
             return True
         except Exception as e:
             print(f"\n❌ Error saving approved items: {e}")
             return False
 
-    def generate_html(self, approved_file: str, output_dir: str) -> bool:
+    def generate_html(self, output_dir: str, approved_file: Optional[str] = None) -> bool:
         """
         Generate final HTML from approved items.
 
         Args:
-            approved_file: Path to approved items JSON
             output_dir: Directory for HTML output (docs/)
+            approved_file: Path to approved items JSON (default: use the
+                data from the last save_approved call)
 
         Returns:
             True if successful
         """
         try:
-            # Load approved data
-            with open(approved_file, 'r') as f:
-                data = json.load(f)
+            # Load approved data (from disk only if not already in memory)
+            if approved_file is not None:
+                data = read_json(approved_file)
+            elif self.approved_data is not None:
+                data = self.approved_data
+            else:
+                print("\n❌ No approved data to generate HTML from.")
+                return False
 
             # Generate AI summary
             print("\n🤖 Generating AI summary...")
@@ -230,33 +358,18 @@ class ContentReviewer:
             print(f"   Summary: {summary[:100]}...")
 
             # Initialize HTML generator
-            template_dir = os.path.join(
-                os.path.dirname(os.path.dirname(__file__)),
-                'generators',
-                'templates'
-            )
-            generator = HTMLGenerator(template_dir, output_dir)
+            generator = HTMLGenerator(self.template_dir, output_dir)
 
-            # Generate site (this also copies CSS and saves JSON internally)
-            generator.generate_site(
+            # Generate site (this also copies CSS and saves JSON internally),
+            # then the archive page and index for this date; stops at the first error
+            date = data.get('date')
+            generator.generate_all(
                 trending_content=data['content'],
                 stats=data['stats'],
-                summary=summary
+                summary=summary,
+                date=date
             )
 
-            # Generate archive page for this date
-            date = data.get('date')
-            if date:
-                generator.generate_archive_page(
-                    date=date,
-                    trending_content=data['content'],
-                    stats=data['stats'],
-                    summary=summary
-                )
-
-                # Regenerate archive index
-                generator.generate_archive_index()
-
             print(f"\n✅ Generated HTML site in: {output_dir}/")
             print(f"   - index.html ({len(data['content'])} items)")
             print(f"   - data.json")
@@ -273,25 +386,43 @@ class ContentReviewer:
             return False
 
 
+def find_latest_candidates_file(data_dir: Path) -> Optional[Path]:
+    """
+    Find the newest trending_candidates_*.json file in a directory.
+
+    Args:
+        data_dir: Directory to search
+
+    Returns:
+        Path to the newest candidates file, or None if there are none
+    """
+    if not data_dir.is_dir():
+        return None
+
+    with os.scandir(data_dir) as entries:
+        latest_name = max(
+            (entry.name for entry in entries
+             if entry.name.startswith('trending_candidates_') and entry.name.endswith('.json')),
+            default=None
+        )
+
+    return data_dir / latest_name if latest_name else None
+
+
 def main():
     """Main entry point for content review."""
 
-    # Determine paths
-    project_root = Path(__file__).parent.parent
-    data_dir = project_root / 'data' / 'processed'
-    docs_dir = project_root / 'docs'
-
     # Find most recent candidates file
     today = datetime.now().strftime('%Y%m%d')
-    candidates_file = data_dir / f'trending_candidates_{today}.json'
-    approved_file = data_dir / f'trending_approved_{today}.json'
+    candidates_file = PROCESSED_DIR / f'trending_candidates_{today}.json'
+    approved_file = PROCESSED_DIR / f'trending_approved_{today}.json'
 
     # Check if candidates file exists
     if not candidates_file.exists():
-        # Try to find any candidates file
-        candidates_files = sorted(data_dir.glob('trending_candidates_*.json'), reverse=True)
-        if candidates_files:
-            candidates_file = candidates_files[0]
+        # Try to find the most recent candidates file (names sort by date)
+        latest_file = find_latest_candidates_file(PROCESSED_DIR)
+        if latest_file:
+            candidates_file = latest_file
             print(f"ℹ️  Using most recent candidates file: {candidates_file.name}")
         else:
             print("❌ No candidates file found. Run the pipeline first:")
@@ -313,30 +444,31 @@ def main():
         return 0
 
     # Show summary
-    print("\n" + "=" * 80)
+    print("\n" + SEPARATOR)
     print("📊 REVIEW SUMMARY")
-    print("=" * 80)
-    total_candidates = len(reviewer.candidates_data.get('content', []))
+    print(SEPARATOR)
+    total_candidates = reviewer.total_candidates
+    approved_count = len(approved_items)
     print(f"Total candidates: {total_candidates}")
-    print(f"Approved items: {len(approved_items)}")
-    print(f"Approval rate: {len(approved_items) / total_candidates * 100:.1f}%")
+    print(f"Approved items: {approved_count}")
+    print(f"Approval rate: {format_rate(approved_count, total_candidates)}")
 
     # Save approved items
     if not reviewer.save_approved(str(approved_file)):
         return 1
 
     # Ask if user wants to generate HTML now
-    print("\n" + "=" * 80)
-    generate = input("🎨 Generate HTML site from approved items? (y/n): ").lower().strip()
+    print("\n" + SEPARATOR)
+    generate = prompt("🎨 Generate HTML site from approved items? (y/n): ")
 
     if generate == 'y':
-        if reviewer.generate_html(str(approved_file), str(docs_dir)):
-            print("\n" + "=" * 80)
+        if reviewer.generate_html(str(DOCS_DIR)):
+            print("\n" + SEPARATOR)
             print("✅ CONTENT REVIEW COMPLETE!")
-            print("=" * 80)
-            print(f"\nYour curated site is ready at: {docs_dir}/index.html")
+            print(SEPARATOR)
+            print(f"\nYour curated site is ready at: {DOCS_DIR}/index.html")
             print(f"Review it locally before deploying to GitHub Pages.")
-            print(f"\nTo view: open {docs_dir}/index.html")
+            print(f"\nTo view: open {DOCS_DIR}/index.html")
         else:
             return 1
     else:
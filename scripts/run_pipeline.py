@@ -8,7 +8,7 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime, timezone
-import json
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 # Add project root to path
@@ -19,9 +19,15 @@ from scrapers.reddit_scraper import RedditScraper
 from scrapers.news_scraper import NewsScraper
 from processors.canadian_filter import CanadianFilter
 from processors.content_ranker import ContentRanker
+from processors.json_io import write_json
 from generators.html_generator import HTMLGenerator
 
 
+# Log banner lines
+SEPARATOR = "=" * 70
+BANNER = "*" * 70
+
+
 # Configuration
 class Config:
     """Pipeline configuration"""
@@ -90,16 +96,19 @@ def ensure_directories():
     Config.OUTPUT_DIR.mkdir(exist_ok=True)
 
 
-def scrape_reddit(logger) -> tuple[list, bool]:
+def scrape_reddit(logger, today: str) -> tuple[list, bool]:
     """
     Scrape Reddit posts.
 
+    Args:
+        today: Run date stamp (YYYYMMDD) used for output filenames
+
     Returns:
         (posts, success) tuple
     """
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("STEP 1: Scraping Reddit")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
     try:
         scraper = RedditScraper()
@@ -109,79 +118,57 @@ def scrape_reddit(logger) -> tuple[list, bool]:
         )
 
         # Save raw data
-        today = datetime.now().strftime('%Y%m%d')
         raw_file = Config.RAW_DIR / f'reddit_{today}.json'
         scraper.save_to_json(posts, str(raw_file))
 
-        logger.info(f"✓ Reddit: {len(posts)} posts scraped and saved to {raw_file}")
+        logger.info("✓ Reddit: %d posts scraped and saved to %s", len(posts), raw_file)
         return posts, True
 
     except Exception as e:
-        logger.error(f"✗ Reddit scraping failed: {e}", exc_info=True)
+        logger.error("✗ Reddit scraping failed: %s", e, exc_info=True)
         return [], False
 
 
-def scrape_news(logger) -> tuple[list, bool]:
+def scrape_news(logger, today: str) -> tuple[list, bool]:
     """
     Scrape news articles (with timeout protection).
 
+    Args:
+        today: Run date stamp (YYYYMMDD) used for output filenames
+
     Returns:
         (articles, success) tuple
     """
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("STEP 2: Scraping News (Optional)")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
     if not Config.ENABLE_NEWS_SCRAPING:
         logger.info("News scraping disabled in config")
         return [], False
 
     try:
-        # Try with shorter timeout
-        import socket
-        original_timeout = socket.getdefaulttimeout()
-        socket.setdefaulttimeout(Config.NEWS_TIMEOUT)
-
         scraper = NewsScraper()
+        sources_tried = len(scraper.RSS_FEEDS)
 
-        # Try one source at a time with individual error handling
-        all_articles = []
-        sources_tried = 0
-        sources_succeeded = 0
-
-        for source_name, feed_url in scraper.RSS_FEEDS.items():
-            sources_tried += 1
-            try:
-                logger.info(f"Trying {source_name}...")
-                articles = scraper.scrape_rss_feed(feed_url, source_name)
-                if articles:
-                    all_articles.extend(articles)
-                    sources_succeeded += 1
-                    logger.info(f"✓ {source_name}: {len(articles)} articles")
-                else:
-                    logger.warning(f"⚠ {source_name}: No articles found")
-            except Exception as e:
-                logger.warning(f"✗ {source_name} failed: {e}")
-                continue
-
-        # Restore original timeout
-        socket.setdefaulttimeout(original_timeout)
+        # Feeds are fetched concurrently (with retries); failures are logged per source
+        all_articles = scraper.scrape_all(timeout=Config.NEWS_TIMEOUT)
+        sources_succeeded = len({article['source'] for article in all_articles})
 
         if all_articles:
             # Save raw data
-            today = datetime.now().strftime('%Y%m%d')
             raw_file = Config.RAW_DIR / f'news_{today}.json'
             scraper.save_to_json(all_articles, str(raw_file))
 
-            logger.info(f"✓ News: {len(all_articles)} articles from {sources_succeeded}/{sources_tried} sources")
-            logger.info(f"  Saved to {raw_file}")
+            logger.info("✓ News: %d articles from %d/%d sources", len(all_articles), sources_succeeded, sources_tried)
+            logger.info("  Saved to %s", raw_file)
             return all_articles, True
         else:
             logger.warning("⚠ News scraping failed - no articles retrieved")
             return [], False
 
     except Exception as e:
-        logger.error(f"✗ News scraping failed: {e}")
+        logger.error("✗ News scraping failed: %s", e)
         return [], False
 
 
@@ -192,22 +179,22 @@ def filter_content(reddit_posts, news_articles, logger) -> tuple[list, list]:
     Returns:
         (canadian_reddit, canadian_news) tuple
     """
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("STEP 3: Filtering for Canadian Relevance")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
     canadian_filter = CanadianFilter()
 
     # Filter Reddit
     canadian_reddit = canadian_filter.filter_by_subreddit(reddit_posts)
-    logger.info(f"Reddit: {len(reddit_posts)} → {len(canadian_reddit)} Canadian posts")
+    logger.info("Reddit: %d → %d Canadian posts", len(reddit_posts), len(canadian_reddit))
 
     # Filter News (high threshold for strong Canadian relevance)
     canadian_news = canadian_filter.filter_canadian_content(news_articles, threshold=0.45)
-    logger.info(f"News: {len(news_articles)} → {len(canadian_news)} Canadian articles")
+    logger.info("News: %d → %d Canadian articles", len(news_articles), len(canadian_news))
 
     total_canadian = len(canadian_reddit) + len(canadian_news)
-    logger.info(f"Total Canadian content: {total_canadian} items")
+    logger.info("Total Canadian content: %d items", total_canadian)
 
     return canadian_reddit, canadian_news
 
@@ -219,63 +206,66 @@ def rank_content(canadian_reddit, canadian_news, logger) -> list:
     Returns:
         Ranked content list
     """
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("STEP 4: Ranking Content")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
     ranker = ContentRanker()
     ranked = ranker.rank_all_content(canadian_reddit, canadian_news)
 
     if ranked:
-        logger.info(f"Ranked {len(ranked)} items")
-        logger.info(f"  Top score: {ranked[0]['trending_score']:.3f}")
-        logger.info(f"  Bottom score: {ranked[-1]['trending_score']:.3f}")
-
-        # Show top 5
-        logger.info("\nTop 5 Trending:")
-        for i, item in enumerate(ranked[:5], 1):
-            ctype = item['content_type'].upper()
-            title = item['title'][:50]
-            score = item['trending_score']
-            can_score = item['canadian_score']
-            logger.info(f"  {i}. [{ctype}] {title}... (trending: {score:.2f}, canadian: {can_score:.2f})")
+        logger.info("Ranked %d items", len(ranked))
+        logger.info("  Top score: %.3f", ranked[0]['trending_score'])
+        logger.info("  Bottom score: %.3f", ranked[-1]['trending_score'])
+
+        # Show top 5 (skip building previews when INFO is disabled)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("\nTop 5 Trending:")
+            for i, item in enumerate(ranked[:5], 1):
+                logger.info(
+                    "  %d. [%s] %s... (trending: %.2f, canadian: %.2f)",
+                    i, item['content_type'].upper(), item['title'][:50],
+                    item['trending_score'], item['canadian_score']
+                )
     else:
         logger.warning("No content to rank!")
 
     return ranked
 
 
-def save_candidates(ranked_content, stats, logger) -> bool:
+def save_candidates(ranked_content, stats, logger, today: str) -> bool:
     """
     Save trending candidates for editorial review.
     Does NOT generate HTML - that's done after review.
 
+    Args:
+        today: Run date stamp (YYYYMMDD) used for the filename and 'date' field
+
     Returns:
         Success boolean
     """
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("STEP 5: Saving Candidates for Review")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
     try:
         # Save candidates data
-        today = datetime.now().strftime('%Y%m%d')
         candidates_file = Config.PROCESSED_DIR / f'trending_candidates_{today}.json'
 
-        with open(candidates_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'date': today,
-                'generated_at': datetime.now(timezone.utc).isoformat(),
-                'stats': stats,
-                'content': ranked_content  # All candidates (not just top 100)
-            }, f, indent=2, ensure_ascii=False)
+        # Compact output: candidates are read by the review tool, not by hand
+        write_json(str(candidates_file), {
+            'date': today,
+            'generated_at': datetime.now(timezone.utc).isoformat(),
+            'stats': stats,
+            'content': ranked_content  # All candidates (not just top 100)
+        }, indent=False)
 
-        logger.info(f"✓ Saved {len(ranked_content)} candidates: {candidates_file}")
+        logger.info("✓ Saved %d candidates: %s", len(ranked_content), candidates_file)
 
         return True
 
     except Exception as e:
-        logger.error(f"✗ Failed to save candidates: {e}", exc_info=True)
+        logger.error("✗ Failed to save candidates: %s", e, exc_info=True)
         return False
 
 
@@ -288,24 +278,30 @@ def main():
 
     start_time = datetime.now()
 
-    logger.info("*" * 70)
+    # Single date stamp for every file written by this run (even across midnight)
+    today = start_time.strftime('%Y%m%d')
+
+    logger.info(BANNER)
     logger.info("CANADIAN PET PULSE - PRODUCTION PIPELINE")
-    logger.info(f"Started: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info("*" * 70)
+    logger.info("Started: %s", start_time.strftime('%Y-%m-%d %H:%M:%S'))
+    logger.info(BANNER)
 
     # Track successes
     sources_succeeded = []
     sources_failed = []
 
-    # Step 1: Scrape Reddit
-    reddit_posts, reddit_success = scrape_reddit(logger)
+    # Steps 1 & 2: Scrape Reddit and News (optional) concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        reddit_future = executor.submit(scrape_reddit, logger, today)
+        news_future = executor.submit(scrape_news, logger, today)
+        reddit_posts, reddit_success = reddit_future.result()
+        news_articles, news_success = news_future.result()
+
     if reddit_success:
         sources_succeeded.append('reddit')
     else:
         sources_failed.append('reddit')
 
-    # Step 2: Scrape News (optional)
-    news_articles, news_success = scrape_news(logger)
     if news_success:
         sources_succeeded.append('news')
     else:
@@ -315,17 +311,20 @@ def main():
     total_scraped = len(reddit_posts) + len(news_articles)
 
     if len(sources_succeeded) < Config.MIN_SOURCES_SUCCESS:
-        logger.error(f"✗ PIPELINE FAILED: Too few sources succeeded ({len(sources_succeeded)}/{Config.MIN_SOURCES_SUCCESS} required)")
-        logger.error(f"  Succeeded: {sources_succeeded}")
-        logger.error(f"  Failed: {sources_failed}")
+        logger.error(
+            "✗ PIPELINE FAILED: Too few sources succeeded (%d/%d required)",
+            len(sources_succeeded), Config.MIN_SOURCES_SUCCESS
+        )
+        logger.error("  Succeeded: %s", sources_succeeded)
+        logger.error("  Failed: %s", sources_failed)
         return False
 
-    logger.info(f"\nData collection summary:")
-    logger.info(f"  Reddit: {len(reddit_posts)} posts")
-    logger.info(f"  News: {len(news_articles)} articles")
-    logger.info(f"  Total: {total_scraped} items")
-    logger.info(f"  Sources succeeded: {sources_succeeded}")
-    logger.info(f"  Sources failed: {sources_failed}")
+    logger.info("\nData collection summary:")
+    logger.info("  Reddit: %d posts", len(reddit_posts))
+    logger.info("  News: %d articles", len(news_articles))
+    logger.info("  Total: %d items", total_scraped)
+    logger.info("  Sources succeeded: %s", sources_succeeded)
+    logger.info("  Sources failed: %s", sources_failed)
 
     # Step 3: Filter
     canadian_reddit, canadian_news = filter_content(reddit_posts, news_articles, logger)
@@ -333,7 +332,10 @@ def main():
     total_canadian = len(canadian_reddit) + len(canadian_news)
 
     if total_canadian < Config.MIN_TOTAL_ITEMS:
-        logger.error(f"✗ PIPELINE FAILED: Too few Canadian items ({total_canadian}/{Config.MIN_TOTAL_ITEMS} required)")
+        logger.error(
+            "✗ PIPELINE FAILED: Too few Canadian items (%d/%d required)",
+            total_canadian, Config.MIN_TOTAL_ITEMS
+        )
         return False
 
     # Step 4: Rank
@@ -352,7 +354,7 @@ def main():
         'sources_failed': sources_failed,
     }
 
-    save_success = save_candidates(ranked_content, stats, logger)
+    save_success = save_candidates(ranked_content, stats, logger, today)
 
     if not save_success:
         logger.error("✗ PIPELINE FAILED: Failed to save candidates")
@@ -362,20 +364,20 @@ def main():
     end_time = datetime.now()
     duration = (end_time - start_time).total_seconds()
 
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
     logger.info("PIPELINE COMPLETE - CANDIDATES READY FOR REVIEW")
-    logger.info("=" * 70)
-    logger.info(f"Duration: {duration:.1f} seconds")
-    logger.info(f"Candidates generated: {len(ranked_content)}")
-    logger.info(f"Canadian items: {total_canadian}")
-    logger.info(f"Sources succeeded: {', '.join(sources_succeeded)}")
+    logger.info(SEPARATOR)
+    logger.info("Duration: %.1f seconds", duration)
+    logger.info("Candidates generated: %d", len(ranked_content))
+    logger.info("Canadian items: %d", total_canadian)
+    logger.info("Sources succeeded: %s", ', '.join(sources_succeeded))
     if sources_failed:
-        logger.info(f"Sources failed: {', '.join(sources_failed)}")
+        logger.info("Sources failed: %s", ', '.join(sources_failed))
     logger.info("")
     logger.info("NEXT STEP: Editorial review")
     logger.info("Run: python scripts/review_content.py")
     logger.info("This will let you review and approve items before publishing.")
-    logger.info("=" * 70)
+    logger.info(SEPARATOR)
 
     return True
 
@@ -388,5 +390,5 @@ if __name__ == '__main__':
         print("\n\nPipeline interrupted by user")
         sys.exit(1)
     except Exception as e:
-        logging.error(f"Pipeline crashed: {e}", exc_info=True)
+        logging.error("Pipeline crashed: %s", e, exc_info=True)
         sys.exit(1)
@@ -7,6 +7,8 @@ Tests the complete processing pipeline with real scraped data.
 import sys
 from pathlib import Path
 
+import requests
+
 # Add project root to path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
@@ -28,8 +30,10 @@ def test_integrated_pipeline():
     print("\n[1/5] Scraping Sample Data...")
     print("-" * 70)
 
-    reddit_scraper = RedditScraper()
-    news_scraper = NewsScraper()
+    # Share one session (and its connection pool) between both scrapers
+    session = requests.Session()
+    reddit_scraper = RedditScraper(session=session)
+    news_scraper = NewsScraper(session=session)
 
     # Scrape a few subreddits
     test_subreddits = ['dogs', 'toronto']
@@ -4,11 +4,41 @@ Test script to validate scraper functionality before full implementation.
 Run this to test Reddit and News scraping independently.
 """
 
+import asyncio
+import sys
+from pathlib import Path
+
 import requests
 import feedparser
-import time
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import aiohttp
+except ImportError:  # Optional: falls back to a thread pool over SESSION
+    aiohttp = None
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from processors.keyword_matcher import KeywordMatcher
+
+USER_AGENT = 'CanadianPetPulse/0.1.0 (Educational Project)'
+
+# Shared session so repeated requests reuse TCP/TLS connections
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': USER_AGENT})
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+))
 
 
 def test_reddit_json():
@@ -18,14 +48,19 @@ def test_reddit_json():
     print("=" * 60)
 
     url = "https://www.reddit.com/r/dogs/top.json?t=day&limit=25"
-    headers = {'User-Agent': 'CanadianPetPulse/0.1.0 (Educational Project)'}
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = SESSION.get(url, timeout=10)
         print(f"Status Code: {response.status_code}")
 
         if response.status_code == 200:
             data = response.json()
+
+            reason = find_incomplete_data(data)
+            if reason:
+                print(f"✗ Malformed listing: {reason}")
+                return False
+
             posts = data['data']['children']
             print(f"✓ Retrieved {len(posts)} posts from r/dogs")
 
@@ -59,39 +94,126 @@ def test_reddit_json():
         return False
 
 
+def fetch_all(urls):
+    """
+    Fetch several URLs concurrently.
+
+    Uses aiohttp + asyncio.gather (at most 4 requests in flight) when aiohttp
+    is installed, otherwise falls back to a thread pool over SESSION.
+
+    Returns:
+        List of (status_code, body_bytes) tuples, or the exception raised, in URL order
+    """
+    if aiohttp is None:
+        def fetch_one(url):
+            try:
+                response = SESSION.get(url, timeout=10)
+                return response.status_code, response.content
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=4) as executor:  # Politeness limit per host
+            return list(executor.map(fetch_one, urls))
+
+    async def fetch(session, sem, url):
+        async with sem, session.get(url) as response:
+            return response.status, await response.read()
+
+    async def fetch_concurrently():
+        sem = asyncio.Semaphore(4)  # Politeness limit per host
+        timeout = aiohttp.ClientTimeout(total=10)
+        headers = {'User-Agent': USER_AGENT}
+        async with aiohttp.ClientSession(headers=headers, timeout=timeout) as session:
+            return await asyncio.gather(
+                *(fetch(session, sem, url) for url in urls),
+                return_exceptions=True
+            )
+
+    return asyncio.run(fetch_concurrently())
+
+
+def find_incomplete_data(listing):
+    """
+    Detect structurally broken Reddit listing responses.
+
+    A short listing is not an error (a quiet subreddit may have fewer
+    posts than the requested limit); only a missing data/children
+    structure or posts without a score count as incomplete.
+
+    Returns:
+        Reason string if the listing is broken, otherwise None
+    """
+    data = listing.get('data') if isinstance(listing, dict) else None
+    if not isinstance(data, dict):
+        return "missing 'data'"
+
+    children = data.get('children')
+    if not isinstance(children, list):
+        return "missing 'children'"
+
+    for child in children:
+        post = child.get('data') if isinstance(child, dict) else None
+        if not isinstance(post, dict):
+            return "malformed post entries"
+        if post.get('score') is None:
+            return "posts missing scores"
+
+    return None
+
+
 def test_multiple_subreddits():
-    """Test 2 - Multi-subreddit scraping with rate limiting"""
+    """Test 2 - Multi-subreddit scraping (concurrent, semaphore-limited)"""
     print("\n" + "=" * 60)
     print("TEST 2: Multi-Subreddit Scraping")
     print("=" * 60)
 
     subreddits = ['dogs', 'puppy101', 'toronto', 'vancouver']
-    headers = {'User-Agent': 'CanadianPetPulse/0.1.0 (Educational Project)'}
+    limit = 10
 
     results = {}
+    pending = subreddits
 
-    for sub in subreddits:
-        url = f"https://www.reddit.com/r/{sub}/top.json?t=day&limit=10"
+    # Re-scrape (once) any subreddit whose listing came back incomplete
+    for attempt in range(2):
+        urls = [f"https://www.reddit.com/r/{sub}/top.json?t=day&limit={limit}" for sub in pending]
+        incomplete = []
 
-        try:
-            response = requests.get(url, headers=headers, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                post_count = len(data['data']['children'])
-                results[sub] = post_count
-                print(f"✓ r/{sub}: {post_count} posts")
-            else:
+        for sub, result in zip(pending, fetch_all(urls)):
+            if isinstance(result, Exception):
                 results[sub] = 0
-                print(f"✗ r/{sub}: Failed (status {response.status_code})")
+                print(f"✗ r/{sub}: Error - {result}")
+                continue
 
-            # Rate limiting - wait 2 seconds between requests
-            if sub != subreddits[-1]:  # Don't wait after last one
-                print(f"  Waiting 2 seconds (rate limiting)...")
-                time.sleep(2)
+            status, body = result
+            if status != 200:
+                results[sub] = 0
+                print(f"✗ r/{sub}: Failed (status {status})")
+                continue
 
-        except Exception as e:
-            results[sub] = 0
-            print(f"✗ r/{sub}: Error - {e}")
+            try:
+                listing = json.loads(body)
+            except ValueError as e:
+                results[sub] = 0
+                print(f"✗ r/{sub}: Invalid JSON - {e}")
+                continue
+
+            reason = find_incomplete_data(listing)
+            if reason:
+                if attempt == 0:
+                    print(f"⚠ r/{sub}: Incomplete data ({reason}), re-scraping")
+                    incomplete.append(sub)
+                else:
+                    results[sub] = 0
+                    print(f"✗ r/{sub}: Incomplete data ({reason})")
+                continue
+
+            children = listing['data']['children']
+            results[sub] = len(children)
+            print(f"✓ r/{sub}: {len(children)} posts")
+
+        pending = incomplete
+        if not pending:
+            break
 
     total = sum(results.values())
     print(f"\nTotal posts retrieved: {total}")
@@ -112,9 +234,13 @@ def test_rss_feeds():
 
     results = {}
 
-    for source, url in feeds.items():
+    for source, result in zip(feeds, fetch_all(list(feeds.values()))):
         try:
-            feed = feedparser.parse(url)
+            if isinstance(result, Exception):
+                raise result
+
+            # Parse downloaded bytes (feedparser doesn't fetch anything itself)
+            feed = feedparser.parse(result[1])
 
             if feed.entries:
                 entry_count = len(feed.entries)
@@ -145,30 +271,33 @@ def test_pet_filtering():
     print("TEST 4: Pet Content Filtering")
     print("=" * 60)
 
-    pet_keywords = ['dog', 'cat', 'pet', 'puppy', 'kitten', 'animal', 'veterinary', 'vet']
+    pet_keywords = ['dog', 'cat', 'pet', 'puppy', 'vet', 'kitten', 'animal', 'veterinary']
+    pet_matcher = KeywordMatcher(pet_keywords)
 
     try:
-        feed = feedparser.parse('https://www.cbc.ca/webfeed/rss/rss-canada')
+        response = SESSION.get('https://www.cbc.ca/webfeed/rss/rss-canada', timeout=15)
+        feed = feedparser.parse(response.content)
 
-        pet_stories = []
-        for entry in feed.entries:
-            title_lower = entry.title.lower()
-            summary_lower = entry.get('summary', '').lower()
+        # Scan title and summary together in a single pass
+        pet_stories = (
+            entry.title for entry in feed.entries
+            if pet_matcher.contains_any(entry.title + " " + entry.get('summary', ''))
+        )
 
-            if any(keyword in title_lower or keyword in summary_lower
-                   for keyword in pet_keywords):
-                pet_stories.append(entry.title)
+        # Only the first 5 titles are kept; the rest are just counted
+        top_stories = list(islice(pet_stories, 5))
+        remaining = sum(1 for _ in pet_stories)
 
         print(f"Total entries: {len(feed.entries)}")
-        print(f"Pet-related stories: {len(pet_stories)}")
+        print(f"Pet-related stories: {len(top_stories) + remaining}")
 
-        if pet_stories:
+        if top_stories:
             print(f"\nPet stories found:")
-            for i, story in enumerate(pet_stories[:5], 1):
+            for i, story in enumerate(top_stories, 1):
                 print(f"  {i}. {story}")
 
-            if len(pet_stories) > 5:
-                print(f"  ... and {len(pet_stories) - 5} more")
+            if remaining:
+                print(f"  ... and {remaining} more")
 
         return True
 
@@ -195,16 +324,17 @@ def test_canadian_detection():
     ]
 
     canadian_keywords = [
-        'toronto', 'vancouver', 'montreal', 'calgary', 'ottawa',
-        'edmonton', 'winnipeg', 'canadian', 'canada', 'bc', 'ontario',
-        'quebec', 'alberta'
+        'canada', 'canadian', 'toronto', 'vancouver', 'bc', 'ontario',
+        'montreal', 'calgary', 'ottawa', 'alberta', 'quebec',
+        'edmonton', 'winnipeg'
     ]
+    canadian_matcher = KeywordMatcher(canadian_keywords)
 
     correct = 0
     total = len(test_cases)
 
     for text, expected in test_cases:
-        is_canadian = any(kw in text.lower() for kw in canadian_keywords)
+        is_canadian = canadian_matcher.contains_any(text)
         status = "✓" if is_canadian == expected else "✗"
 
         if is_canadian == expected:
@@ -0,0 +1,34 @@
+"""
+Shared test helper for code with an optional fast backend.
+Runs a test against the installed backend and the pure-Python fallback.
+"""
+
+import functools
+from unittest import mock
+
+
+def each_backend(module, name):
+    """
+    Decorate a test method to run once per available backend.
+
+    The first pass runs with the optional dependency as installed (skipped
+    when it is not), the second with it patched to None so the fallback
+    path is taken. Each pass runs in its own subTest.
+
+    Args:
+        module: Module that imports the optional dependency
+        name: Module attribute bound to the dependency (None if missing)
+    """
+    def decorator(test_method):
+        @functools.wraps(test_method)
+        def wrapper(test):
+            installed = getattr(module, name)
+            backends = (installed, None) if installed is not None else (None,)
+
+            for backend in backends:
+                with test.subTest(**{name: backend is not None}), \
+                        mock.patch.object(module, name, backend):
+                    test_method(test)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,85 @@
+"""Tests for processors.json_io."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from processors import json_io
+from processors.json_io import parse_json, read_json, write_json
+from tests.backends import each_backend
+
+DATA = {
+    'date': '2025-01-15',
+    'stats': {'total_items': 2},
+    'content': [
+        {'title': 'Chien perdu à Montréal', 'score': 12, 'canadian_score': 0.5},
+        {'title': 'Toronto dog park', 'score': 3, 'tags': []},
+    ],
+}
+
+
+class TestWriteJson(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'data.json')
+
+    def read_text(self):
+        with open(self.path, encoding='utf-8') as f:
+            return f.read()
+
+    @each_backend(json_io, 'orjson')
+    def test_indents_by_default(self):
+        write_json(self.path, DATA)
+        self.assertEqual(self.read_text(), json.dumps(DATA, indent=2, ensure_ascii=False))
+
+    @each_backend(json_io, 'orjson')
+    def test_compact(self):
+        write_json(self.path, DATA, indent=False)
+        self.assertEqual(self.read_text(),
+                         json.dumps(DATA, separators=(',', ':'), ensure_ascii=False))
+
+    @each_backend(json_io, 'orjson')
+    def test_keeps_non_ascii(self):
+        write_json(self.path, DATA)
+        self.assertIn('à Montréal', self.read_text())
+
+
+class TestReadJson(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'data.json')
+
+    @each_backend(json_io, 'orjson')
+    def test_round_trip(self):
+        write_json(self.path, DATA)
+        self.assertEqual(read_json(self.path), DATA)
+
+    @each_backend(json_io, 'orjson')
+    def test_invalid_file_raises_json_decode_error(self):
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{"content": [')
+
+        with self.assertRaises(json.JSONDecodeError):
+            read_json(self.path)
+
+
+class TestParseJson(unittest.TestCase):
+
+    @each_backend(json_io, 'orjson')
+    def test_parses_utf8_bytes(self):
+        body = json.dumps(DATA, ensure_ascii=False).encode('utf-8')
+        self.assertEqual(parse_json(body), DATA)
+
+    @each_backend(json_io, 'orjson')
+    def test_invalid_bytes_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            parse_json(b'{"data": ')
+
+
+if __name__ == '__main__':
+    unittest.main()
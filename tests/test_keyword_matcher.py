@@ -0,0 +1,57 @@
+"""Tests for processors.keyword_matcher."""
+
+import unittest
+
+from processors import keyword_matcher
+from processors.keyword_matcher import KeywordMatcher
+from tests.backends import each_backend
+
+KEYWORDS = ['Canada', 'toronto', 'canadian', 'BC']
+
+
+class TestKeywordMatcher(unittest.TestCase):
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_automaton_built_only_with_pyahocorasick(self):
+        matcher = KeywordMatcher(KEYWORDS)
+        self.assertEqual(matcher._automaton is not None,
+                         keyword_matcher.ahocorasick is not None)
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_keywords_are_lowercased_and_deduplicated(self):
+        matcher = KeywordMatcher(['Dog', 'dog', 'CAT'])
+        self.assertEqual(matcher.keywords, ('dog', 'cat'))
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_contains_any_is_case_insensitive(self):
+        matcher = KeywordMatcher(KEYWORDS)
+        self.assertTrue(matcher.contains_any('Adopting a dog in TORONTO'))
+        self.assertFalse(matcher.contains_any('Adopting a dog in Seattle'))
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_contains_any_matches_substrings(self):
+        matcher = KeywordMatcher(KEYWORDS)
+        # 'bc' occurs inside 'abc', as with `keyword in text.lower()`
+        self.assertTrue(matcher.contains_any('abc'))
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_count_distinct_counts_each_keyword_once(self):
+        matcher = KeywordMatcher(KEYWORDS)
+        # 'canada' occurs twice but is counted once
+        text = 'Canada, canada and a Canadian dog in Toronto'
+        self.assertEqual(matcher.count_distinct(text), 3)
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_count_distinct_overlapping_keywords(self):
+        matcher = KeywordMatcher(['dog', 'dogs', 'hotdog'])
+        self.assertEqual(matcher.count_distinct('hotdogs'), 3)
+
+    @each_backend(keyword_matcher, 'ahocorasick')
+    def test_empty_keywords_never_match(self):
+        matcher = KeywordMatcher([])
+        self.assertFalse(matcher.contains_any('canada'))
+        self.assertEqual(matcher.count_distinct('canada'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
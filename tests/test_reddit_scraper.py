@@ -0,0 +1,78 @@
+"""Tests for request pacing in scrapers.reddit_scraper."""
+
+import unittest
+from unittest import mock
+
+import requests
+
+from scrapers import base_scraper
+from scrapers.base_scraper import MAX_RETRY_AFTER
+from scrapers.reddit_scraper import RedditScraper
+
+
+def make_response(status_code, headers=None, body=b'{"data": {"children": []}}'):
+    """Build a requests.Response without touching the network."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = 'https://www.reddit.com/r/dogs/top.json'
+    response.headers.update(headers or {})
+    response._content = body
+    return response
+
+
+class TestRateLimitDelay(unittest.TestCase):
+
+    def setUp(self):
+        self.scraper = RedditScraper(rate_limit_delay=2)
+
+    def set_budget(self, remaining, reset):
+        self.scraper.ratelimit_remaining = remaining
+        self.scraper.ratelimit_reset = reset
+
+    def test_default_delay_without_budget_headers(self):
+        self.assertEqual(self.scraper._rate_limit_delay(10), 2)
+
+    def test_default_delay_when_budget_covers_remaining_requests(self):
+        self.set_budget(remaining=50, reset=300)
+        self.assertEqual(self.scraper._rate_limit_delay(10), 2)
+
+    def test_spreads_requests_over_reset_window(self):
+        self.set_budget(remaining=4, reset=40)
+        self.assertEqual(self.scraper._rate_limit_delay(10), 10)
+
+    def test_never_below_minimum_delay(self):
+        self.set_budget(remaining=4, reset=4)
+        self.assertEqual(self.scraper._rate_limit_delay(10), 2)
+
+    def test_exhausted_budget_is_capped(self):
+        self.set_budget(remaining=0, reset=600)
+        self.assertEqual(self.scraper._rate_limit_delay(10), MAX_RETRY_AFTER)
+
+
+class TestTooManyRequests(unittest.TestCase):
+
+    def scrape(self, *responses):
+        scraper = RedditScraper()
+        scraper.session.get = mock.Mock(side_effect=responses)
+
+        with mock.patch.object(base_scraper.time, 'sleep') as sleep:
+            posts = scraper.scrape_subreddit('dogs')
+
+        return posts, [c.args[0] for c in sleep.call_args_list]
+
+    def test_waits_retry_after_once(self):
+        _, waits = self.scrape(make_response(429, {'Retry-After': '7'}), make_response(200))
+        self.assertEqual(waits, [7])
+
+    def test_retry_after_is_capped(self):
+        _, waits = self.scrape(make_response(429, {'Retry-After': '999'}), make_response(200))
+        self.assertEqual(waits, [MAX_RETRY_AFTER])
+
+    def test_backs_off_without_retry_after(self):
+        posts, waits = self.scrape(make_response(429), make_response(200))
+        self.assertEqual(posts, [])
+        self.assertEqual(waits, [5.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
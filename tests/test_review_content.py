@@ -0,0 +1,104 @@
+"""Tests for loading and reviewing candidates in scripts/review_content.py."""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from processors.json_io import write_json
+from scripts import review_content
+from scripts.review_content import ContentReviewer
+from tests.backends import each_backend
+
+CANDIDATES = {
+    'date': '2025-01-15',
+    'generated_at': '2025-01-15T12:00:00+00:00',
+    # Deliberately stale: the reviewer must count the items itself
+    'stats': {'total_items': 0, 'sources_succeeded': ['reddit']},
+    'content': [
+        {'title': 'Toronto dog park', 'content_type': 'reddit', 'subreddit': 'toronto',
+         'tags': [{'a': [1]}]},
+        {'title': 'Vancouver cat cafe', 'content_type': 'reddit', 'subreddit': 'vancouver'},
+        {'title': 'Ottawa shelter news', 'content_type': 'news'},
+    ],
+    'review_notes': None,
+}
+
+
+class TestContentReviewer(unittest.TestCase):
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'trending_candidates.json')
+
+        # Keep the terminal output of the reviewer out of the test log
+        patcher = mock.patch('builtins.print')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def load(self, data=CANDIDATES):
+        write_json(self.path, data)
+        reviewer = ContentReviewer(self.path)
+        return reviewer, reviewer.load_candidates()
+
+    @each_backend(review_content, 'ijson')
+    def test_counts_items_instead_of_trusting_stats(self):
+        reviewer, loaded = self.load()
+        self.assertTrue(loaded)
+        self.assertEqual(reviewer.total_candidates, 3)
+
+    @each_backend(review_content, 'ijson')
+    def test_iterates_all_items_in_order(self):
+        reviewer, _ = self.load()
+        titles = [item['title'] for item in reviewer.iter_candidates()]
+        self.assertEqual(titles, [item['title'] for item in CANDIDATES['content']])
+
+    @each_backend(review_content, 'ijson')
+    def test_keeps_top_level_metadata(self):
+        reviewer, _ = self.load()
+        self.assertEqual(reviewer.candidates_data['date'], '2025-01-15')
+        self.assertEqual(reviewer.candidates_data['stats'], CANDIDATES['stats'])
+        self.assertIsNone(reviewer.candidates_data['review_notes'])
+
+    @each_backend(review_content, 'ijson')
+    def test_streaming_leaves_content_on_disk(self):
+        reviewer, _ = self.load()
+        streaming = review_content.ijson is not None
+        self.assertEqual('content' in reviewer.candidates_data, not streaming)
+
+    @each_backend(review_content, 'ijson')
+    def test_missing_content_list_has_no_items(self):
+        reviewer, loaded = self.load({'date': '2025-01-15'})
+        self.assertTrue(loaded)
+        self.assertEqual(reviewer.total_candidates, 0)
+        self.assertEqual(list(reviewer.iter_candidates()), [])
+
+    @each_backend(review_content, 'ijson')
+    def test_content_only_file_is_reviewed(self):
+        reviewer, _ = self.load({'content': CANDIDATES['content'][:1]})
+        self.assertEqual(reviewer.total_candidates, 1)
+
+        with mock.patch.object(review_content, 'prompt', return_value='y'):
+            approved = reviewer.review_interactive()
+
+        self.assertEqual([item['title'] for item in approved], ['Toronto dog park'])
+
+    @each_backend(review_content, 'ijson')
+    def test_truncated_file_is_rejected(self):
+        write_json(self.path, CANDIDATES)
+        with open(self.path, 'rb+') as f:
+            f.truncate(os.path.getsize(self.path) - 40)
+
+        self.assertFalse(ContentReviewer(self.path).load_candidates())
+
+    def test_missing_file_is_rejected(self):
+        self.assertFalse(ContentReviewer(self.path).load_candidates())
+
+    def test_format_rate(self):
+        self.assertEqual(review_content.format_rate(1, 3), '33.3%')
+        self.assertEqual(review_content.format_rate(0, 0), '0.0%')
+
+
+if __name__ == '__main__':
+    unittest.main()